@@ -0,0 +1,136 @@
+import asyncio
+from typing import Any, Callable, List, Optional, Tuple
+from pymongo.errors import BulkWriteError, WriteError
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBatcher:
+    """Coalesces concurrent write operations into MongoDB bulk writes."""
+
+    def __init__(
+        self,
+        get_collection: Callable[[], Any],
+        max_batch_size: int = 50,
+        max_delay: float = 0.005
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            get_collection: Returns the asyncio collection each batch is written to
+            max_batch_size: Maximum number of operations per bulk write
+            max_delay: Seconds to wait for more operations before flushing
+        """
+        self.get_collection = get_collection
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, operation) -> None:
+        """
+        Queue a write operation and wait until its bulk write completes.
+
+        Args:
+            operation: A pymongo write model such as InsertOne or UpdateOne
+
+        Raises:
+            WriteError: If MongoDB rejected this particular operation
+        """
+        if self._worker is None or self._worker.done():
+            self._start()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((operation, future))
+        await future
+
+    async def close(self) -> None:
+        """Flush the operations still queued, then stop the worker."""
+        if self._worker is None:
+            return
+
+        if not self._worker.done():
+            drained = asyncio.ensure_future(self._queue.join())
+            await asyncio.wait({drained, self._worker}, return_when=asyncio.FIRST_COMPLETED)
+            drained.cancel()
+            self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Batch writer worker died: {e}")
+        self._worker = None
+
+        # Anything left was queued behind a dead worker and will never be written
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Batch writer closed before the write completed"))
+
+    def _start(self) -> None:
+        """Start a fresh queue and worker, carrying over anything a dead worker left queued."""
+        if self._worker is not None and not self._worker.cancelled() and self._worker.exception():
+            logger.error(f"Batch writer worker died: {self._worker.exception()}")
+
+        pending = []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+
+        self._queue = asyncio.Queue()
+        for item in pending:
+            self._queue.put_nowait(item)
+        self._worker = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Collect queued operations into batches and flush them."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                deadline = loop.time() + self.max_delay
+
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._flush(batch)
+            finally:
+                # Never leave a waiter hanging if the worker is cancelled or fails mid-batch
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(RuntimeError("Batch writer stopped before the write completed"))
+                    self._queue.task_done()
+
+    async def _flush(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Write a batch with one bulk_write and resolve each waiter."""
+        operations = [operation for operation, _ in batch]
+        write_errors = {}
+
+        try:
+            await self.get_collection().bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            write_errors = {error["index"]: error for error in e.details.get("writeErrors", [])}
+        except Exception as e:
+            logger.error(f"Bulk write of {len(batch)} operations failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            error = write_errors.get(index)
+            if error:
+                future.set_exception(WriteError(error.get("errmsg"), error.get("code"), error))
+            else:
+                future.set_result(None)
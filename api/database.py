@@ -1,45 +1,86 @@
+from dotenv import load_dotenv
+
+# Load environment variables once at import, before motor sizes its
+# thread pool from MOTOR_MAX_WORKERS
+load_dotenv()
+
 from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+from pymongo.server_api import ServerApi
 import os
-from dotenv import load_dotenv
+import threading
 from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Get MongoDB URI from environment variable or use default
+MONGODB_URI = os.getenv('MONGODB_URI')
+DB_NAME = os.getenv('DB_NAME')
+
+# Connection pool sizing
+MONGO_MAX_POOL = int(os.getenv('MONGO_MAX_POOL', '200'))
+MONGO_MIN_POOL = int(os.getenv('MONGO_MIN_POOL', '10'))
+
+# Cached collection handles, reset when the connection is closed
+_enrollment_collection = None
+_async_enrollment_collection = None
+
 
 class DatabaseConnection:
     """Singleton MongoDB connection manager."""
     _instance = None
     _client = None
+    _async_client = None
+    _lock = threading.Lock()
 
     @classmethod
     def get_instance(cls):
         """Get singleton instance of database connection."""
         if cls._instance is None:
-            cls._instance = DatabaseConnection()
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = DatabaseConnection()
         return cls._instance
 
     def __init__(self):
         """Initialize database connection configuration."""
-        # Load environment variables
-        load_dotenv()
-        
-        # Get MongoDB URI from environment variable or use default
-        self.mongodb_uri = os.getenv('MONGODB_URI')
-        self.db_name = os.getenv('DB_NAME')
+        self.mongodb_uri = MONGODB_URI
+        self.db_name = DB_NAME
+        self.max_pool_size = MONGO_MAX_POOL
+        self.min_pool_size = MONGO_MIN_POOL
+
+    def _client_options(self) -> dict:
+        """Get keyword options shared by the sync and asyncio clients."""
+        return {
+            "serverSelectionTimeoutMS": 5000,
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "maxIdleTimeMS": 300000,
+            "waitQueueTimeoutMS": 5000,
+            "retryWrites": True,
+            "compressors": "zstd,snappy,zlib",
+            "zlibCompressionLevel": 3,
+            "server_api": ServerApi("1"),
+            # Decode students_info ids (subtype 4 Binary) straight to uuid.UUID
+            "uuidRepresentation": "standard",
+            "appname": "validation_agent",
+        }
 
     def connect(self):
         """Establish connection to MongoDB."""
         try:
             if not self._client:
-                self._client = MongoClient(
-                    self.mongodb_uri, 
-                    serverSelectionTimeoutMS=5000
-                )
-                # Verify connection
-                self._client.admin.command('ping')
-                logger.info("Successfully connected to MongoDB")
+                with self._lock:
+                    if not self._client:
+                        self._client = MongoClient(
+                            self.mongodb_uri, 
+                            **self._client_options()
+                        )
+                        # Verify connection
+                        self._client.admin.command('ping')
+                        logger.info("Successfully connected to MongoDB")
             return self._client
         except ConnectionFailure as e:
             logger.error(f"Failed to connect to MongoDB server: {e}")
@@ -59,12 +100,40 @@ class DatabaseConnection:
         db = self.get_database()
         return db[collection_name]
 
+    def get_async_client(self) -> AsyncIOMotorClient:
+        """Get the asyncio MongoDB client used by the API."""
+        if not self._async_client:
+            with self._lock:
+                if not self._async_client:
+                    self._async_client = AsyncIOMotorClient(
+                        self.mongodb_uri,
+                        **self._client_options()
+                    )
+        return self._async_client
+
+    def get_async_database(self):
+        """Get asyncio database instance."""
+        return self.get_async_client()[self.db_name]
+
+    def get_async_collection(self, collection_name: str):
+        """Get asyncio collection from database."""
+        db = self.get_async_database()
+        return db[collection_name]
+
     def close_connection(self):
         """Close MongoDB connection."""
+        global _enrollment_collection, _async_enrollment_collection
+        _enrollment_collection = None
+        _async_enrollment_collection = None
+
         if self._client:
             self._client.close()
             self._client = None
             logger.info("MongoDB connection closed")
+        if self._async_client:
+            self._async_client.close()
+            self._async_client = None
+            logger.info("Async MongoDB connection closed")
 
     def is_connected(self) -> bool:
         """Check if database connection is active."""
@@ -76,11 +145,40 @@ class DatabaseConnection:
             pass
         return False
 
+    async def ensure_indexes(self):
+        """Create the indexes backing the API lookups."""
+        db = self.get_async_database()
+        await db['enrollmentForm'].create_index("uuid_str", unique=True, background=True)
+
+        processes = db['validation_processes']
+        await processes.create_index("process_id", unique=True, background=True)
+
+        # Optionally expire old validation processes
+        process_ttl = os.getenv('PROCESS_TTL_SECONDS')
+        if process_ttl:
+            await processes.create_index(
+                "created_at",
+                expireAfterSeconds=int(process_ttl),
+                background=True
+            )
+        logger.info("MongoDB indexes ensured")
+
+    async def is_connected_async(self) -> bool:
+        """Check if the asyncio database connection is active."""
+        try:
+            await self.get_async_client().admin.command('ping')
+            return True
+        except Exception:
+            return False
+
 
 def get_enrollment_collection():
     """Helper function to get enrollment collection."""
-    db = DatabaseConnection.get_instance()
-    return db.get_collection('enrollmentForm')
+    global _enrollment_collection
+    if _enrollment_collection is None:
+        db = DatabaseConnection.get_instance()
+        _enrollment_collection = db.get_collection('enrollmentForm')
+    return _enrollment_collection
 
 
 def get_students_collection():
@@ -89,6 +187,15 @@ def get_students_collection():
     return db.get_collection('students')
 
 
+def get_async_enrollment_collection():
+    """Helper function to get asyncio enrollment collection."""
+    global _async_enrollment_collection
+    if _async_enrollment_collection is None:
+        db = DatabaseConnection.get_instance()
+        _async_enrollment_collection = db.get_async_collection('enrollmentForm')
+    return _async_enrollment_collection
+
+
 # Example usage and test function
 def test_connection():
     """Test database connection."""
@@ -97,7 +204,7 @@ def test_connection():
         collection = get_enrollment_collection()
         
         # Test the connection with a simple query
-        doc_count = collection.count_documents({})
+        doc_count = collection.estimated_document_count()
         logger.info(f"Successfully connected. Found {doc_count} documents in enrollmentForm.")
         
         return True
@@ -1,9 +1,12 @@
-from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
+import contextlib
 import logging
 import os
+import orjson
 from typing import Optional
 from datetime import datetime, timezone
 
@@ -14,6 +17,7 @@ from api.models import (
     ValidationStatus
 )
 from api.services import ValidationServiceFactory, ValidationService
+from api.database import DatabaseConnection
 from api.exceptions import ValidationAPIException
 
 # Configure logging
@@ -23,6 +27,48 @@ logger = logging.getLogger(__name__)
 # Global service instance
 validation_service: Optional[ValidationService] = None
 
+# Static body of the root endpoint, serialized once
+ROOT_BODY = orjson.dumps({
+    "message": "Student Validation API",
+    "status": "healthy",
+    "version": "1.0.0"
+})
+
+# Static body returned for unexpected errors
+INTERNAL_ERROR_BODY = orjson.dumps({
+    "error": "Internal server error",
+    "detail": "An unexpected error occurred",
+    "code": "INTERNAL_ERROR"
+})
+
+# Status messages for validation processes; FAILED is formatted per process
+STATUS_MESSAGES = {
+    ValidationStatus.PENDING: "Validation process is pending",
+    ValidationStatus.IN_PROGRESS: "Validation process is in progress",
+    ValidationStatus.COMPLETED: "Validation process completed successfully"
+}
+
+# Cached database health, refreshed in the background so /health never waits on MongoDB
+HEALTH_CHECK_INTERVAL = float(os.getenv("HEALTH_CHECK_INTERVAL", "10"))
+database_health = {"status": "unknown", "last_checked": None}
+
+
+async def _periodic_ping():
+    """Ping MongoDB at a fixed interval and cache the result."""
+    db = DatabaseConnection.get_instance()
+    
+    while True:
+        try:
+            if await db.is_connected_async():
+                database_health["status"] = "connected"
+            else:
+                database_health["status"] = "disconnected"
+        except Exception as e:
+            database_health["status"] = f"error: {str(e)}"
+        database_health["last_checked"] = datetime.now(timezone.utc).isoformat()
+        
+        await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -46,12 +92,25 @@ async def lifespan(app: FastAPI):
             logger.error(f"All backends failed: {fallback_error}")
             raise RuntimeError("Unable to initialize any validation service backend")
     
+    health_task = asyncio.create_task(_periodic_ping())
+    
+    try:
+        await DatabaseConnection.get_instance().ensure_indexes()
+    except Exception as e:
+        logger.error(f"Failed to ensure MongoDB indexes: {e}")
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Student Validation API...")
+    health_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await health_task
+    try:
+        await validation_service.close()
+    except Exception as e:
+        logger.error(f"Error closing validation service: {e}")
     try:
-        from api.database import DatabaseConnection
         DatabaseConnection.get_instance().close_connection()
     except Exception as e:
         logger.error(f"Error closing database connection: {e}")
@@ -64,6 +123,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -80,7 +140,7 @@ app.add_middleware(
 @app.exception_handler(ValidationAPIException)
 async def validation_exception_handler(request: Request, exc: ValidationAPIException):
     """Handle custom validation API exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.message,
@@ -93,7 +153,7 @@ async def validation_exception_handler(request: Request, exc: ValidationAPIExcep
 @app.exception_handler(ValueError)
 async def value_error_handler(request: Request, exc: ValueError):
     """Handle ValueError exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content={
             "error": "Invalid input",
@@ -107,24 +167,17 @@ async def value_error_handler(request: Request, exc: ValueError):
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
     logger.error(f"Unexpected error: {exc}", exc_info=True)
-    return JSONResponse(
+    return Response(
+        content=INTERNAL_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "Internal server error",
-            "detail": "An unexpected error occurred",
-            "code": "INTERNAL_ERROR"
-        }
+        media_type="application/json"
     )
 
 
 @app.get("/", tags=["Health"])
 async def root():
     """Health check endpoint."""
-    return {
-        "message": "Student Validation API",
-        "status": "healthy",
-        "version": "1.0.0"
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health", tags=["Health"])
@@ -135,21 +188,13 @@ async def health_check():
         "service": "student-validation-api",
         "version": "1.0.0",
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "database": "unknown",
+        "database": database_health["status"],
+        "last_checked": database_health["last_checked"],
         "validation_service": "unknown"
     }
     
-    # Check database connectivity
-    try:
-        from api.database import DatabaseConnection
-        db = DatabaseConnection.get_instance()
-        if db.is_connected():
-            health_status["database"] = "connected"
-        else:
-            health_status["database"] = "disconnected"
-            health_status["status"] = "degraded"
-    except Exception as e:
-        health_status["database"] = f"error: {str(e)}"
+    # Database connectivity comes from the background ping
+    if database_health["status"] != "connected":
         health_status["status"] = "degraded"
     
     # Check validation service
@@ -278,12 +323,10 @@ async def get_validation_status(process_id: str) -> ValidationProcessResponse:
             )
         
         # Determine message based on status
-        status_messages = {
-            ValidationStatus.PENDING: "Validation process is pending",
-            ValidationStatus.IN_PROGRESS: "Validation process is in progress",
-            ValidationStatus.COMPLETED: "Validation process completed successfully",
-            ValidationStatus.FAILED: f"Validation process failed: {process.error_message or 'Unknown error'}"
-        }
+        if process.status is ValidationStatus.FAILED:
+            message = f"Validation process failed: {process.error_message or 'Unknown error'}"
+        else:
+            message = STATUS_MESSAGES.get(process.status, "Unknown status")
         
         return ValidationProcessResponse(
             process_id=process.process_id,
@@ -291,7 +334,7 @@ async def get_validation_status(process_id: str) -> ValidationProcessResponse:
             email=process.email,
             status=process.status,
             created_at=process.created_at,
-            message=status_messages.get(process.status, "Unknown status")
+            message=message
         )
         
     except HTTPException:
@@ -1,10 +1,15 @@
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from enum import Enum
+from dataclasses import dataclass
 import uuid
 from datetime import datetime
 
 
+# Standard UUID format, validated by pydantic-core's compiled regex engine
+UUID_PATTERN = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+
+
 class ValidationStatus(str, Enum):
     """Validation process status enumeration."""
     PENDING = "pending"
@@ -27,7 +32,7 @@ class ValidateStudentRequest(BaseModel):
         ...,
         min_length=36,
         max_length=36,
-        pattern=r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
+        pattern=UUID_PATTERN,
         description="Enrollment UUID in standard UUID format"
     )
 
@@ -72,7 +77,8 @@ class ErrorResponse(BaseModel):
     code: Optional[str] = Field(None, description="Error code for programmatic handling")
 
 
-class ValidationProcess(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ValidationProcess:
     """Internal model representing a validation process."""
     process_id: str
     uuid_str: str
@@ -1,12 +1,19 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
-import uuid
 from datetime import datetime, timezone
+from functools import cached_property
+from pymongo import InsertOne, ReturnDocument
 from api.models import ValidationProcess, ValidationStatus
 from api.exceptions import EnrollmentNotFoundError, ValidationProcessNotFoundError
-from api.database import get_enrollment_collection, DatabaseConnection
+from api.database import get_async_enrollment_collection, DatabaseConnection
+from api.batching import AsyncBatcher
 import logging
 
+try:
+    from uuid import uuid7
+except ImportError:  # Python < 3.14
+    from uuid6 import uuid7
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,17 +21,27 @@ class EnrollmentRepository(ABC):
     """Abstract repository for enrollment data access."""
     
     @abstractmethod
-    def get_by_uuid(self, uuid_str: str) -> Optional[Dict[str, Any]]:
+    async def get_by_uuid(self, uuid_str: str) -> Optional[Dict[str, Any]]:
         """Get enrollment by UUID."""
         pass
     
     @abstractmethod
-    def exists(self, uuid_str: str) -> bool:
+    async def get_email_by_uuid(self, uuid_str: str) -> Optional[Dict[str, Any]]:
+        """Get only the email of an enrollment by UUID."""
+        pass
+    
+    @abstractmethod
+    async def summarize_by_uuid(self, uuid_str: str) -> Optional[Dict[str, Any]]:
+        """Get the contact details and student count of an enrollment by UUID."""
+        pass
+    
+    @abstractmethod
+    async def exists(self, uuid_str: str) -> bool:
         """Check if enrollment exists."""
         pass
     
     @abstractmethod
-    def get_all_uuids(self) -> List[str]:
+    async def get_all_uuids(self) -> List[str]:
         """Get all enrollment UUIDs."""
         pass
 
@@ -38,43 +55,89 @@ class MongoEnrollmentRepository(EnrollmentRepository):
     def __init__(self):
         self.db_connection = DatabaseConnection.get_instance()
     
-    def get_by_uuid(self, uuid_str: str) -> Optional[Dict[str, Any]]:
+    @property
+    def _collection(self):
+        """Enrollment collection, resolved through the module-level memo so reconnects are picked up."""
+        return get_async_enrollment_collection()
+    
+    async def get_by_uuid(self, uuid_str: str) -> Optional[Dict[str, Any]]:
         """Get enrollment by UUID from MongoDB."""
         try:
-            # Query enrollmentForm collection by uuid_str
-            enrollment_collection = get_enrollment_collection()
-            enrollment = enrollment_collection.find_one({"uuid_str": uuid_str})
+            # Query enrollmentForm collection by uuid_str, leaving out _id
+            return await self._collection.find_one(
+                {"uuid_str": uuid_str},
+                projection={"_id": 0}
+            )
             
-            if enrollment:
-                # Convert MongoDB document to dict and remove _id
-                enrollment_dict = dict(enrollment)
-                if '_id' in enrollment_dict:
-                    del enrollment_dict['_id']
-                return enrollment_dict
-                
+        except Exception as e:
+            logger.error(f"Error retrieving enrollment {uuid_str}: {e}")
             return None
+    
+    async def get_email_by_uuid(self, uuid_str: str) -> Optional[Dict[str, Any]]:
+        """Get only the email of an enrollment by UUID from MongoDB."""
+        try:
+            # Fetch just the email instead of the whole enrollment document
+            enrollment = await self._collection.find_one(
+                {"uuid_str": uuid_str},
+                projection={"email": 1}
+            )
+            if not enrollment:
+                return None
+            
+            return {"email": enrollment.get("email")}
             
         except Exception as e:
-            logger.error(f"Error retrieving enrollment {uuid_str}: {e}")
+            logger.error(f"Error retrieving email for enrollment {uuid_str}: {e}")
+            return None
+    
+    async def summarize_by_uuid(self, uuid_str: str) -> Optional[Dict[str, Any]]:
+        """Get the contact details and student count of an enrollment from MongoDB."""
+        try:
+            # Count students server-side so the students_info array never crosses the wire
+            cursor = self._collection.aggregate([
+                {"$match": {"uuid_str": uuid_str}},
+                {"$limit": 1},
+                {"$project": {
+                    "_id": 0,
+                    "email": 1,
+                    "phone": 1,
+                    "students_count": {"$size": {"$ifNull": ["$students_info", []]}},
+                    "verified": {"$ifNull": ["$verification.verified", False]}
+                }}
+            ])
+            summaries = await cursor.to_list(length=1)
+            
+            return summaries[0] if summaries else None
+            
+        except Exception as e:
+            logger.error(f"Error summarizing enrollment {uuid_str}: {e}")
             return None
     
-    def exists(self, uuid_str: str) -> bool:
+    async def exists(self, uuid_str: str) -> bool:
         """Check if enrollment exists in MongoDB."""
-        return self.get_by_uuid(uuid_str) is not None
+        try:
+            # Only the _id is needed to answer an existence check
+            enrollment = await self._collection.find_one(
+                {"uuid_str": uuid_str},
+                projection={"_id": 1}
+            )
+            return enrollment is not None
+
+        except Exception as e:
+            logger.error(f"Error checking enrollment {uuid_str}: {e}")
+            return False
     
-    def get_all_uuids(self) -> List[str]:
+    async def get_all_uuids(self) -> List[str]:
         """Get all enrollment UUIDs from MongoDB."""
         try:
-            uuids = []
-            
-            # Get UUIDs from enrollmentForm collection
-            enrollment_collection = get_enrollment_collection()
-            enrollment_docs = enrollment_collection.find({}, {"uuid_str": 1, "_id": 0})
-            for doc in enrollment_docs:
-                if "uuid_str" in doc:
-                    uuids.append(doc["uuid_str"])
+            # Get UUIDs from enrollmentForm collection in large cursor batches
+            cursor = self._collection.find(
+                {"uuid_str": {"$exists": True}},
+                {"uuid_str": 1, "_id": 0}
+            ).batch_size(1000)
+            enrollment_docs = await cursor.to_list(length=None)
             
-            return uuids
+            return [doc["uuid_str"] for doc in enrollment_docs]
             
         except Exception as e:
             logger.error(f"Error retrieving enrollment UUIDs: {e}")
@@ -85,17 +148,17 @@ class ValidationProcessRepository(ABC):
     """Abstract repository for validation process data access."""
     
     @abstractmethod
-    def create(self, uuid_str: str, email: Optional[str] = None) -> ValidationProcess:
+    async def create(self, uuid_str: str, email: Optional[str] = None) -> ValidationProcess:
         """Create a new validation process."""
         pass
     
     @abstractmethod
-    def get_by_id(self, process_id: str) -> Optional[ValidationProcess]:
+    async def get_by_id(self, process_id: str) -> Optional[ValidationProcess]:
         """Get validation process by ID."""
         pass
     
     @abstractmethod
-    def update_status(
+    async def update_status(
         self, 
         process_id: str, 
         status: ValidationStatus,
@@ -105,6 +168,10 @@ class ValidationProcessRepository(ABC):
         """Update validation process status."""
         pass
 
+    async def close(self) -> None:
+        """Release any background resources held by the repository."""
+        pass
+
 
 class InMemoryValidationProcessRepository(ValidationProcessRepository):
     """In-memory validation process repository implementation."""
@@ -112,9 +179,9 @@ class InMemoryValidationProcessRepository(ValidationProcessRepository):
     def __init__(self):
         self._processes: Dict[str, ValidationProcess] = {}
     
-    def create(self, uuid_str: str, email: Optional[str] = None) -> ValidationProcess:
+    async def create(self, uuid_str: str, email: Optional[str] = None) -> ValidationProcess:
         """Create a new validation process."""
-        process_id = str(uuid.uuid4())
+        process_id = str(uuid7())
         process = ValidationProcess(
             process_id=process_id,
             uuid_str=uuid_str,
@@ -125,11 +192,11 @@ class InMemoryValidationProcessRepository(ValidationProcessRepository):
         self._processes[process_id] = process
         return process
     
-    def get_by_id(self, process_id: str) -> Optional[ValidationProcess]:
+    async def get_by_id(self, process_id: str) -> Optional[ValidationProcess]:
         """Get validation process by ID."""
         return self._processes.get(process_id)
     
-    def update_status(
+    async def update_status(
         self, 
         process_id: str, 
         status: ValidationStatus,
@@ -137,24 +204,16 @@ class InMemoryValidationProcessRepository(ValidationProcessRepository):
         result_data: Optional[dict] = None
     ) -> ValidationProcess:
         """Update validation process status."""
-        process = self.get_by_id(process_id)
+        process = self._processes.get(process_id)
         if not process:
             raise ValidationProcessNotFoundError(process_id)
         
-        # Create updated process
-        updated_process = ValidationProcess(
-            process_id=process.process_id,
-            uuid_str=process.uuid_str,
-            email=process.email,
-            status=status,
-            created_at=process.created_at,
-            updated_at=datetime.now(timezone.utc),
-            error_message=error_message,
-            result_data=result_data
-        )
-        
-        self._processes[process_id] = updated_process
-        return updated_process
+        # Update the stored process in place
+        process.status = status
+        process.updated_at = datetime.now(timezone.utc)
+        process.error_message = error_message
+        process.result_data = result_data
+        return process
 
 
 class MongoValidationProcessRepository(ValidationProcessRepository):
@@ -164,14 +223,25 @@ class MongoValidationProcessRepository(ValidationProcessRepository):
         self.db_connection = DatabaseConnection.get_instance()
         self.collection_name = 'validation_processes'
     
-    def _get_collection(self):
-        """Get validation processes collection."""
-        return self.db_connection.get_collection(self.collection_name)
+    @property
+    def _collection(self):
+        """Validation processes collection on the current asyncio client."""
+        return self.db_connection.get_async_collection(self.collection_name)
+    
+    @cached_property
+    def _batcher(self) -> AsyncBatcher:
+        """Batcher coalescing concurrent process inserts into bulk writes."""
+        return AsyncBatcher(lambda: self._collection)
+    
+    async def close(self) -> None:
+        """Flush pending process inserts and stop the batch writer."""
+        if "_batcher" in self.__dict__:
+            await self._batcher.close()
     
-    def create(self, uuid_str: str, email: Optional[str] = None) -> ValidationProcess:
+    async def create(self, uuid_str: str, email: Optional[str] = None) -> ValidationProcess:
         """Create a new validation process in MongoDB."""
         try:
-            process_id = str(uuid.uuid4())
+            process_id = str(uuid7())
             process = ValidationProcess(
                 process_id=process_id,
                 uuid_str=uuid_str,
@@ -192,8 +262,7 @@ class MongoValidationProcessRepository(ValidationProcessRepository):
                 "result_data": process.result_data
             }
             
-            collection = self._get_collection()
-            collection.insert_one(process_dict)
+            await self._batcher.submit(InsertOne(process_dict))
             
             return process
             
@@ -201,11 +270,10 @@ class MongoValidationProcessRepository(ValidationProcessRepository):
             logger.error(f"Error creating validation process: {e}")
             raise
     
-    def get_by_id(self, process_id: str) -> Optional[ValidationProcess]:
+    async def get_by_id(self, process_id: str) -> Optional[ValidationProcess]:
         """Get validation process by ID from MongoDB."""
         try:
-            collection = self._get_collection()
-            doc = collection.find_one({"process_id": process_id})
+            doc = await self._collection.find_one({"process_id": process_id})
             
             if not doc:
                 return None
@@ -226,7 +294,7 @@ class MongoValidationProcessRepository(ValidationProcessRepository):
             logger.error(f"Error retrieving validation process {process_id}: {e}")
             return None
     
-    def update_status(
+    async def update_status(
         self, 
         process_id: str, 
         status: ValidationStatus,
@@ -235,13 +303,6 @@ class MongoValidationProcessRepository(ValidationProcessRepository):
     ) -> ValidationProcess:
         """Update validation process status in MongoDB."""
         try:
-            collection = self._get_collection()
-            
-            # Get existing process
-            existing_doc = collection.find_one({"process_id": process_id})
-            if not existing_doc:
-                raise ValidationProcessNotFoundError(process_id)
-            
             # Prepare update data
             update_data = {
                 "status": status.value,
@@ -254,14 +315,14 @@ class MongoValidationProcessRepository(ValidationProcessRepository):
             if result_data is not None:
                 update_data["result_data"] = result_data
             
-            # Update in MongoDB
-            collection.update_one(
+            # Update in MongoDB and get the updated document back in one round-trip
+            updated_doc = await self._collection.find_one_and_update(
                 {"process_id": process_id},
-                {"$set": update_data}
+                {"$set": update_data},
+                return_document=ReturnDocument.AFTER
             )
-            
-            # Return updated process
-            updated_doc = collection.find_one({"process_id": process_id})
+            if not updated_doc:
+                raise ValidationProcessNotFoundError(process_id)
             
             return ValidationProcess(
                 process_id=updated_doc["process_id"],
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 import asyncio
+import logging
+import os
 from datetime import datetime, timezone
 
 from api.models import ValidationProcess, ValidationStatus
@@ -10,7 +12,25 @@ from api.exceptions import (
     InvalidUuidFormatError,
     ValidationServiceError
 )
-import re
+
+# Hex digits deleted by bytes.translate; a valid UUID leaves only its four dashes
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+logger = logging.getLogger(__name__)
+
+
+def _read_simulate_delay() -> float:
+    """Read SIMULATE_DELAY, falling back to no delay when the value is not a number."""
+    raw = os.getenv("SIMULATE_DELAY", "0")
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning(f"Ignoring non-numeric SIMULATE_DELAY={raw!r}; using 0")
+        return 0.0
+
+
+# Optional artificial processing delay in seconds, for exercising polling clients
+SIMULATE_DELAY = _read_simulate_delay()
 
 
 class ValidationService(ABC):
@@ -25,6 +45,10 @@ class ValidationService(ABC):
     async def get_validation_status(self, process_id: str) -> Optional[ValidationProcess]:
         """Get status of a validation process."""
         pass
+    
+    async def close(self) -> None:
+        """Release background resources before shutdown."""
+        pass
 
 
 class EnrollmentValidationService(ValidationService):
@@ -44,8 +68,8 @@ class EnrollmentValidationService(ValidationService):
         if not self._validate_uuid_format(uuid_str):
             raise InvalidUuidFormatError(uuid_str)
         
-        # Get enrollment data to extract email
-        enrollment_data = self.enrollment_repository.get_by_uuid(uuid_str)
+        # Get enrollment email; the rest of the document is not needed here
+        enrollment_data = await self.enrollment_repository.get_email_by_uuid(uuid_str)
         if not enrollment_data:
             raise EnrollmentNotFoundError(uuid_str)
         
@@ -54,7 +78,7 @@ class EnrollmentValidationService(ValidationService):
             email = enrollment_data.get("email")
             
             # Create validation process with email
-            process = self.process_repository.create(uuid_str, email)
+            process = await self.process_repository.create(uuid_str, email)
             
             # Start async validation in background
             asyncio.create_task(self._perform_validation(process.process_id))
@@ -64,33 +88,41 @@ class EnrollmentValidationService(ValidationService):
         except Exception as e:
             raise ValidationServiceError(f"Failed to initiate validation: {str(e)}")
     
-    def _validate_uuid_format(self, uuid_str: str) -> bool:
+    @staticmethod
+    def _validate_uuid_format(uuid_str: str) -> bool:
         """Validate UUID format."""
-        uuid_pattern = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
-        return bool(re.match(uuid_pattern, uuid_str, re.IGNORECASE))
+        if len(uuid_str) != 36 or not uuid_str.isascii():
+            return False
+        if uuid_str[8] != "-" or uuid_str[13] != "-" or uuid_str[18] != "-" or uuid_str[23] != "-":
+            return False
+        return uuid_str.encode().translate(None, _HEX_DIGITS) == b"----"
     
     async def get_validation_status(self, process_id: str) -> Optional[ValidationProcess]:
         """Get status of a validation process."""
-        return self.process_repository.get_by_id(process_id)
+        return await self.process_repository.get_by_id(process_id)
+    
+    async def close(self) -> None:
+        """Flush and stop the process repository's background writes."""
+        await self.process_repository.close()
     
     async def _perform_validation(self, process_id: str) -> None:
         """Perform the actual validation process in background."""
         try:
             # Update status to in_progress
-            self.process_repository.update_status(
+            await self.process_repository.update_status(
                 process_id, 
                 ValidationStatus.IN_PROGRESS
             )
             
             # Get the process details
-            process = self.process_repository.get_by_id(process_id)
+            process = await self.process_repository.get_by_id(process_id)
             if not process:
                 return
             
-            # Get enrollment data
-            enrollment_data = self.enrollment_repository.get_by_uuid(process.uuid_str)
-            if not enrollment_data:
-                self.process_repository.update_status(
+            # Get the enrollment fields the result needs in a single aggregation
+            enrollment_summary = await self.enrollment_repository.summarize_by_uuid(process.uuid_str)
+            if not enrollment_summary:
+                await self.process_repository.update_status(
                     process_id,
                     ValidationStatus.FAILED,
                     error_message="Enrollment not found during validation"
@@ -99,24 +131,22 @@ class EnrollmentValidationService(ValidationService):
             
             # Simulate validation process (in real implementation, this would call
             # the enhanced validation agent or document processing services)
-            await asyncio.sleep(2)  # Simulate processing time
-            
-            # Extract student info for validation
-            students_info = enrollment_data.get("students_info", [])
+            if SIMULATE_DELAY:
+                await asyncio.sleep(SIMULATE_DELAY)
             
             # For now, mark as completed with enrollment data
             result_data = {
                 "enrollment_validated": True,
                 "enrollment_uuid": process.uuid_str,
-                "email": enrollment_data.get("email"),
-                "phone": enrollment_data.get("phone"),
-                "students_count": len(students_info),
-                "verification_status": enrollment_data.get("verification", {}).get("verified", False),
+                "email": enrollment_summary.get("email"),
+                "phone": enrollment_summary.get("phone"),
+                "students_count": enrollment_summary["students_count"],
+                "verification_status": enrollment_summary["verified"],
                 "validation_timestamp": datetime.now(timezone.utc).isoformat(),
                 "validation_notes": "Basic enrollment record validation completed"
             }
             
-            self.process_repository.update_status(
+            await self.process_repository.update_status(
                 process_id,
                 ValidationStatus.COMPLETED,
                 result_data=result_data
@@ -124,7 +154,7 @@ class EnrollmentValidationService(ValidationService):
             
         except Exception as e:
             # Mark process as failed
-            self.process_repository.update_status(
+            await self.process_repository.update_status(
                 process_id,
                 ValidationStatus.FAILED,
                 error_message=str(e)
@@ -1,35 +1,250 @@
 import os
+import asyncio
 import base64
-import json
+import hashlib
+import io
+import random
+import re
+import sqlite3
+import threading
+import time
+import httpx
+import orjson
 import requests
-import tempfile
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache
+from importlib.util import find_spec
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from typing import Dict, Any, Optional, List
-from PIL import Image
-from openai import OpenAI
-from student_mongodb_tools import get_student_by_id, get_all_student_ids, update_student
+from openai import (
+    OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient,
+    RateLimitError, APIConnectionError, InternalServerError
+)
+from student_mongodb_tools import (
+    get_student_by_id, get_student_by_id_async, get_students_by_ids,
+    get_all_student_ids, update_student, update_student_async
+)
 
-def download_image_from_url(url: str) -> str:
+# Fields requested from GPT Vision for each birth certificate
+BIRTH_CERTIFICATE_FIELDS = """{
+  "name": "Full name as it appears on the certificate",
+  "first_name": "First name only",
+  "last_name": "Last name only",
+  "date_of_birth": "Date of birth in YYYY-MM-DD format",
+  "place_of_birth": "Place of birth",
+  "father_name": "Father's name",
+  "mother_name": "Mother's name",
+  "gender": "Gender",
+  "certificate_number": "Certificate number if available",
+  "registration_date": "Registration date if available in YYYY-MM-DD format"
+}"""
+
+# Prompt for a single certificate, built once at import
+_BIRTH_CERT_PROMPT = f"""Please extract the following information from this birth certificate image and return it as a JSON object:
+
+{BIRTH_CERTIFICATE_FIELDS}
+
+If any field is not clearly visible or not present, use null for that field. Be very careful to extract the exact text as it appears."""
+
+# Prompt for a batch of certificates; %d is the number of images
+_BATCH_CERT_PROMPT = f"""Please extract the following information from each of these %d birth certificate images. Return a JSON object of the form {{"results": [...]}} with one entry per image, in the order the images are given, each entry shaped like:
+
+{BIRTH_CERTIFICATE_FIELDS}
+
+If any field is not clearly visible or not present, use null for that field. Be very careful to extract the exact text as it appears."""
+
+# Text part of every single-certificate request; the SDK does not mutate it
+_BIRTH_CERT_TEXT_PART = {"type": "text", "text": _BIRTH_CERT_PROMPT}
+
+# Prefix of the data URLs images are sent to GPT Vision as
+_DATA_URL_PREFIX = b"data:image/jpeg;base64,"
+
+# Local birth certificates folder, falling back to a docs folder in the working directory
+DOCS_DIR = os.path.join(os.path.dirname(__file__), "docs")
+if not os.path.exists(DOCS_DIR):
+    DOCS_DIR = "docs"
+
+# Shared HTTP session so repeated S3 requests reuse keep-alive connections
+_SESSION = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+)
+_SESSION.mount("https://", _HTTP_ADAPTER)
+_SESSION.mount("http://", _HTTP_ADAPTER)
+
+# Certificate name -> absolute path, built on first lookup
+_CERT_INDEX: Optional[Dict[str, str]] = None
+
+# Sample certificate (lowest of STU001..STU009) served for UUIDs without a file of their own
+_SAMPLE_CERT_PATH: Optional[str] = None
+
+# validate_image_file results: (path, mtime_ns, size) -> valid for local files,
+# URL -> (expiry, valid) for remote images, which may change behind the same URL
+_IMAGE_FILE_CHECKS: Dict[tuple, bool] = {}
+_IMAGE_URL_CHECKS: Dict[str, tuple] = {}
+IMAGE_URL_CHECK_TTL = 300.0
+IMAGE_CHECK_CACHE_SIZE = 1024
+
+# Outermost JSON object in a free-form model reply
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.S)
+
+# Longest image side sent to GPT Vision; larger scans are downscaled first
+VISION_MAX_SIDE = 2048
+
+# Maximum number of certificates sent in a single vision request
+VISION_BATCH_SIZE = 8
+
+# Concurrent per-image vision requests, and attempts per request on transient errors
+VISION_CONCURRENCY = int(os.getenv("VISION_CONCURRENCY", "5"))
+VISION_MAX_RETRIES = 5
+
+# Vision model used for extraction; part of the result cache key
+VISION_MODEL = "gpt-4o"
+
+# SQLite file caching single-certificate extractions by image hash; empty disables it
+VISION_CACHE_PATH = os.getenv(
+    "VISION_CACHE_PATH",
+    os.path.join(os.path.dirname(__file__), ".cache", "vision_cache.sqlite3")
+)
+
+# Worker threads for the image loading and MongoDB comparison stages of validate_students
+PIPELINE_LOAD_WORKERS = 16
+PIPELINE_DB_WORKERS = 8
+
+# Connection pool of the OpenAI clients, sized for the bulk pipeline's worker threads
+OPENAI_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+OPENAI_HTTP_TIMEOUT = 60.0
+
+# HTTP/2 multiplexes requests over one connection, but httpx needs the optional h2 package
+_OPENAI_HTTP2 = find_spec("h2") is not None
+
+# OpenAI clients, created on first use so their connection pools are reused across calls
+_CLIENT: Optional[OpenAI] = None
+_ASYNC_CLIENT: Optional[AsyncOpenAI] = None
+
+def _get_client() -> OpenAI:
+    """Return the shared OpenAI client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = OpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=DefaultHttpxClient(
+                limits=OPENAI_HTTP_LIMITS,
+                timeout=OPENAI_HTTP_TIMEOUT,
+                http2=_OPENAI_HTTP2
+            )
+        )
+    return _CLIENT
+
+def _get_async_client() -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client, creating it on first use."""
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None:
+        _ASYNC_CLIENT = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=DefaultAsyncHttpxClient(
+                limits=OPENAI_HTTP_LIMITS,
+                timeout=OPENAI_HTTP_TIMEOUT,
+                http2=_OPENAI_HTTP2
+            )
+        )
+    return _ASYNC_CLIENT
+
+# Result cache connection, opened on first use and shared between threads
+_CACHE_CONN: Optional[sqlite3.Connection] = None
+_CACHE_LOCK = threading.Lock()
+
+# Digest of everything besides the image that shapes an extraction, so prompt or
+# model changes invalidate old entries
+_CACHE_KEY_PREFIX = hashlib.sha256(f"{VISION_MODEL}\0{_BIRTH_CERT_PROMPT}\0".encode()).digest()
+
+def _cache_key(image_url: str) -> str:
+    """Cache key for an extraction: SHA-256 of the model, prompt and image data URL."""
+    return hashlib.sha256(_CACHE_KEY_PREFIX + image_url.encode('ascii')).hexdigest()
+
+def _cache_connection() -> Optional[sqlite3.Connection]:
+    """Return the result cache connection, creating the database on first use."""
+    global _CACHE_CONN
+    if _CACHE_CONN is None and VISION_CACHE_PATH:
+        os.makedirs(os.path.dirname(VISION_CACHE_PATH) or ".", exist_ok=True)
+        conn = sqlite3.connect(VISION_CACHE_PATH, check_same_thread=False)
+        conn.execute("CREATE TABLE IF NOT EXISTS extractions (hash TEXT PRIMARY KEY, json BLOB)")
+        _CACHE_CONN = conn
+    return _CACHE_CONN
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Look up a cached extraction, returning None on a miss."""
+    with _CACHE_LOCK:
+        conn = _cache_connection()
+        if conn is None:
+            return None
+        row = conn.execute("SELECT json FROM extractions WHERE hash = ?", (key,)).fetchone()
+    return orjson.loads(row[0]) if row else None
+
+def _cache_put(key: str, extracted_data: Dict[str, Any]) -> None:
+    """Store an extraction in the result cache."""
+    with _CACHE_LOCK:
+        conn = _cache_connection()
+        if conn is None:
+            return
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO extractions (hash, json) VALUES (?, ?)",
+                (key, orjson.dumps(extracted_data))
+            )
+
+def download_image_to_bytes(url: str) -> bytes:
     """
-    Download an image from URL (S3) to a temporary file.
+    Download an image from URL (S3) into memory.
     
     Args:
         url: S3 URL of the image
         
     Returns:
-        Path to the temporary file
+        Raw image bytes
     """
     try:
-        response = requests.get(url, stream=True)
+        response = _SESSION.get(url, stream=True, timeout=30)
         response.raise_for_status()
         
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(mode='wb', suffix='.png', delete=False) as tmp_file:
-            for chunk in response.iter_content(chunk_size=8192):
-                tmp_file.write(chunk)
-            return tmp_file.name
+        buffer = io.BytesIO()
+        for chunk in response.iter_content(chunk_size=65536):
+            buffer.write(chunk)
+        return buffer.getvalue()
     except Exception as e:
         raise Exception(f"Error downloading image from URL: {e}")
 
+def _prepare_image_for_vision(data: bytes) -> bytes:
+    """
+    Downscale an image and re-encode it as JPEG to cut upload size and vision tokens.
+    
+    Args:
+        data: Raw image bytes (PNG or JPEG)
+        
+    Returns:
+        JPEG bytes no larger than VISION_MAX_SIDE on the longest side
+    """
+    # PIL is only needed here, so load it on first use
+    from PIL import Image
+    
+    with Image.open(io.BytesIO(data)) as img:
+        # Already a small JPEG, send it as is
+        if img.format == 'JPEG' and max(img.size) <= VISION_MAX_SIDE:
+            return data
+        
+        img.thumbnail((VISION_MAX_SIDE, VISION_MAX_SIDE), Image.LANCZOS)
+        buffer = io.BytesIO()
+        img.convert('RGB').save(buffer, 'JPEG', quality=85, optimize=True)
+        return buffer.getvalue()
+
+def _to_data_url(image_data: bytes) -> str:
+    """Base64 encode JPEG bytes into a data URL without an intermediate str copy."""
+    # Base64 output is pure ASCII, so join as bytes and decode once
+    return b"".join([_DATA_URL_PREFIX, base64.b64encode(image_data)]).decode('ascii')
+
 def encode_image_to_base64(image_path: str) -> str:
     """
     Encode an image file to base64 string.
@@ -40,8 +255,56 @@ def encode_image_to_base64(image_path: str) -> str:
     Returns:
         Base64 encoded string of the image
     """
-    with open(image_path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode('utf-8')
+    # The modification time and size are part of the cache key, so edited files are re-read
+    stat = os.stat(image_path)
+    return _encode_file_cached(os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=128)
+def _encode_file_cached(abs_path: str, mtime_ns: int, size: int) -> str:
+    """Read and base64 encode a file; cached per (path, mtime, size)."""
+    with open(abs_path, "rb") as image_file:
+        return base64.b64encode(image_file.read()).decode('ascii')
+
+def _file_data_url(image_path: str) -> str:
+    """Data URL of an image file prepared for GPT Vision."""
+    # The modification time and size are part of the cache key, so edited files are re-read
+    stat = os.stat(image_path)
+    return _file_data_url_cached(os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=128)
+def _file_data_url_cached(abs_path: str, mtime_ns: int, size: int) -> str:
+    """Read, prepare and encode a file as a data URL; cached per (path, mtime, size)."""
+    with open(abs_path, "rb") as image_file:
+        return _to_data_url(_prepare_image_for_vision(image_file.read()))
+
+def _build_cert_index() -> Dict[str, str]:
+    """
+    Index the local birth certificates by file name without the .png suffix.
+    
+    Returns:
+        Dictionary mapping certificate names (e.g. STU001) to absolute paths
+    """
+    global _CERT_INDEX, _SAMPLE_CERT_PATH
+    
+    index = {}
+    try:
+        with os.scandir(DOCS_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".png"):
+                    index[entry.name[:-4]] = os.path.abspath(entry.path)
+    except OSError:
+        pass
+    
+    # Resolve the UUID fallback once instead of probing STU001..STU009 on every lookup
+    samples = [f"STU{i:03d}" for i in range(1, 10)]
+    _SAMPLE_CERT_PATH = next((index[name] for name in samples if name in index), None)
+    
+    _CERT_INDEX = index
+    return index
+
+def refresh_cert_index() -> None:
+    """Rebuild the local certificate index, e.g. after adding files to the docs folder."""
+    _build_cert_index()
 
 def get_local_birth_certificate_path(student_id: str) -> Optional[str]:
     """
@@ -54,129 +317,326 @@ def get_local_birth_certificate_path(student_id: str) -> Optional[str]:
     Returns:
         Path to local birth certificate if exists, None otherwise
     """
-    # Try different possible paths
-    possible_paths = []
-    
-    # For UUID, try to find a mapping file or use STU### format
-    # For now, we'll check for STU### files as a fallback
-    base_dir = os.path.join(os.path.dirname(__file__), "docs")
-    
-    # Check if docs directory exists
-    if not os.path.exists(base_dir):
-        base_dir = "docs"  # Try relative path
-    
-    # If it's a UUID, we might need to map it to STU### format
-    # For now, let's check for common patterns
-    if "-" in student_id:  # UUID format
-        # Try STU001, STU002, etc. as examples
-        # In a real system, you'd have a mapping
-        for i in range(1, 10):
-            possible_paths.append(os.path.join(base_dir, f"STU{i:03d}.png"))
-    else:
-        # Direct STU### format
-        possible_paths.append(os.path.join(base_dir, f"{student_id}.png"))
+    index = _CERT_INDEX if _CERT_INDEX is not None else _build_cert_index()
     
-    # Also try the exact student_id as filename
-    possible_paths.append(os.path.join(base_dir, f"{student_id}.png"))
+    # Try the exact student_id as filename
+    path = index.get(student_id)
+    if path or "-" not in student_id:
+        return path
     
-    # Check each possible path
-    for path in possible_paths:
-        if os.path.exists(path):
-            return os.path.abspath(path)
-    
-    return None
+    # UUIDs without their own file fall back to the sample STU### certificate
+    # In a real system, you'd have a mapping
+    return _SAMPLE_CERT_PATH
 
-def extract_data_from_birth_certificate(image_source: str, prefer_local: bool = True) -> Dict[str, Any]:
+def _load_image_data_url(image_source: str, prefer_local: bool = True) -> str:
     """
-    Use GPT Vision to extract structured data from a birth certificate image.
+    Load a birth certificate image as a base64 data URL, reading local files or downloading URLs.
     
     Args:
         image_source: Either a local file path, S3 URL, or student ID
         prefer_local: If True, check for local files first when given a student ID
         
     Returns:
-        Dictionary containing extracted data
+        Data URL of the image, ready to send to GPT Vision
     """
-    image_path = None
-    is_temp = False
-    
     # First check if it's a direct local file path
     if os.path.exists(image_source):
-        image_path = image_source
-    elif prefer_local and not image_source.startswith('http'):
+        return _file_data_url(image_source)
+    
+    if prefer_local and not image_source.startswith('http'):
         # Try to find local birth certificate
         local_path = get_local_birth_certificate_path(image_source)
         if local_path:
-            image_path = local_path
-            print(f"Using local birth certificate: {image_path}")
-    
-    # If no local file found and it's a URL, download it
-    if not image_path and image_source.startswith('http'):
-        image_path = download_image_from_url(image_source)
-        is_temp = True
+            print(f"Using local birth certificate: {local_path}")
+            return _file_data_url(local_path)
     
-    if not image_path:
-        raise FileNotFoundError(f"No birth certificate found for: {image_source}")
+    # If no local file found and it's a URL, encode it straight from memory
+    if image_source.startswith('http'):
+        return _to_data_url(_prepare_image_for_vision(download_image_to_bytes(image_source)))
     
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    raise FileNotFoundError(f"No birth certificate found for: {image_source}")
+
+def _parse_json_content(content: str) -> Any:
+    """
+    Parse the JSON object from a model response.
     
-    try:
-        # Encode image to base64
-        base64_image = encode_image_to_base64(image_path)
+    Args:
+        content: Raw message content returned by the model
         
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": """Please extract the following information from this birth certificate image and return it as a JSON object:
+    Returns:
+        Parsed JSON value
+    """
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        # Without JSON mode the object may be wrapped in prose or code fences
+        match = _JSON_OBJECT_RE.search(content)
+        if not match:
+            raise
+        return orjson.loads(match.group(0))
 
-{
-  "name": "Full name as it appears on the certificate",
-  "first_name": "First name only",
-  "last_name": "Last name only",
-  "date_of_birth": "Date of birth in YYYY-MM-DD format",
-  "place_of_birth": "Place of birth",
-  "father_name": "Father's name",
-  "mother_name": "Mother's name",
-  "gender": "Gender",
-  "certificate_number": "Certificate number if available",
-  "registration_date": "Registration date if available in YYYY-MM-DD format"
-}
+class _JsonObjectScanner:
+    """Tracks brace depth across streamed text to spot the end of the top-level JSON object."""
+    
+    def __init__(self):
+        self.parts: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+    
+    def feed(self, text: str) -> bool:
+        """
+        Add a streamed piece of the reply.
+        
+        Args:
+            text: Next piece of the model's message content
+            
+        Returns:
+            True once the top-level object has been closed
+        """
+        self.parts.append(text)
+        for char in text:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    return True
+        return False
+    
+    @property
+    def content(self) -> str:
+        """Text received so far."""
+        return "".join(self.parts)
 
-If any field is not clearly visible or not present, use null for that field. Be very careful to extract the exact text as it appears."""
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{base64_image}"
-                            }
-                        }
-                    ]
+def _single_certificate_messages(image_url: str) -> List[Dict[str, Any]]:
+    """
+    Build the chat messages asking GPT Vision to extract one birth certificate.
+    
+    Args:
+        image_url: Data URL of the JPEG image
+        
+    Returns:
+        List of chat messages for the completion request
+    """
+    return [
+        {
+            "role": "user",
+            "content": [
+                _BIRTH_CERT_TEXT_PART,
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": image_url
+                    }
                 }
-            ],
-            max_tokens=500
-        )
+            ]
+        }
+    ]
+
+def extract_data_from_birth_certificate(image_source: str, prefer_local: bool = True) -> Dict[str, Any]:
+    """
+    Use GPT Vision to extract structured data from a birth certificate image.
+    
+    Args:
+        image_source: Either a local file path, S3 URL, or student ID
+        prefer_local: If True, check for local files first when given a student ID
         
-        # Parse the JSON response
-        content = response.choices[0].message.content
+    Returns:
+        Dictionary containing extracted data
+    """
+    return _extract_from_data_url(_load_image_data_url(image_source, prefer_local))
+
+def _extract_from_data_url(image_url: str) -> Dict[str, Any]:
+    """
+    Send one prepared birth certificate image to GPT Vision and parse the reply.
+    Results are cached on disk, so re-validating an unchanged image costs no request.
+    
+    Args:
+        image_url: Data URL of the JPEG image
         
-        # Clean up the response to extract JSON
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
+    Returns:
+        Dictionary containing extracted data
+    """
+    cache_key = _cache_key(image_url)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
+    client = _get_client()
+    
+    stream = client.chat.completions.create(
+        model=VISION_MODEL,
+        messages=_single_certificate_messages(image_url),
+        max_tokens=500,
+        response_format={"type": "json_object"},
+        temperature=0,
+        seed=42,
+        stream=True
+    )
+    
+    # Stop reading as soon as the object closes; JSON mode can pad the
+    # reply with whitespace up to max_tokens
+    scanner = _JsonObjectScanner()
+    try:
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content and scanner.feed(chunk.choices[0].delta.content):
+                break
+    finally:
+        stream.close()
+    
+    # Parse the JSON response
+    extracted_data = _parse_json_content(scanner.content)
+    _cache_put(cache_key, extracted_data)
+    return extracted_data
+
+async def extract_many_async(
+    image_sources: List[str],
+    concurrency: int = VISION_CONCURRENCY,
+    prefer_local: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Extract data from several birth certificates with concurrent per-image requests.
+    Use this instead of extract_data_from_birth_certificates when each image
+    should get its own request.
+    
+    Args:
+        image_sources: Local file paths, S3 URLs, or student IDs
+        concurrency: Maximum number of vision requests in flight at once
+        prefer_local: If True, check for local files first when given a student ID
         
-        extracted_data = json.loads(content.strip())
-        return extracted_data
+    Returns:
+        List of extracted data dictionaries, in the same order as image_sources
+    """
+    client = _get_async_client()
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def extract_one(image_source: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await _extract_one_async(client, image_source, prefer_local)
+    
+    return await asyncio.gather(*(extract_one(source) for source in image_sources))
+
+async def _extract_one_async(client: AsyncOpenAI, image_source: str, prefer_local: bool) -> Dict[str, Any]:
+    """
+    Extract one birth certificate, retrying transient API errors with jittered backoff.
+    
+    Args:
+        client: Async OpenAI client to send the request with
+        image_source: Either a local file path, S3 URL, or student ID
+        prefer_local: If True, check for local files first when given a student ID
         
+    Returns:
+        Dictionary containing extracted data
+    """
+    # Reading, downloading and encoding are blocking, keep them off the event loop
+    image_url = await asyncio.to_thread(_load_image_data_url, image_source, prefer_local)
+    
+    cache_key = _cache_key(image_url)
+    cached = await asyncio.to_thread(_cache_get, cache_key)
+    if cached is not None:
+        return cached
+    
+    for attempt in range(VISION_MAX_RETRIES):
+        try:
+            stream = await client.chat.completions.create(
+                model=VISION_MODEL,
+                messages=_single_certificate_messages(image_url),
+                max_tokens=500,
+                response_format={"type": "json_object"},
+                temperature=0,
+                seed=42,
+                stream=True
+            )
+            break
+        except (RateLimitError, APIConnectionError, InternalServerError):
+            if attempt == VISION_MAX_RETRIES - 1:
+                raise
+            await asyncio.sleep(min(30, 2 ** attempt) * random.uniform(0.5, 1.5))
+    
+    scanner = _JsonObjectScanner()
+    try:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content and scanner.feed(chunk.choices[0].delta.content):
+                break
     finally:
-        # Clean up temporary file if we downloaded it
-        if is_temp and image_path and os.path.exists(image_path):
-            os.unlink(image_path)
+        await stream.close()
+    
+    extracted_data = _parse_json_content(scanner.content)
+    await asyncio.to_thread(_cache_put, cache_key, extracted_data)
+    return extracted_data
+
+def extract_data_from_birth_certificates(image_sources: List[str], prefer_local: bool = True) -> List[Dict[str, Any]]:
+    """
+    Use GPT Vision to extract structured data from several birth certificate images.
+    Images are sent VISION_BATCH_SIZE at a time, one request per batch.
+    
+    Args:
+        image_sources: Local file paths, S3 URLs, or student IDs
+        prefer_local: If True, check for local files first when given a student ID
+        
+    Returns:
+        List of extracted data dictionaries, in the same order as image_sources
+    """
+    client = _get_client()
+    
+    results = []
+    for start in range(0, len(image_sources), VISION_BATCH_SIZE):
+        batch = image_sources[start:start + VISION_BATCH_SIZE]
+        results.extend(_extract_batch(client, batch, prefer_local))
+    
+    return results
+
+def _extract_batch(client: OpenAI, image_sources: List[str], prefer_local: bool) -> List[Dict[str, Any]]:
+    """
+    Extract data from one batch of birth certificates with a single vision request.
+    
+    Args:
+        client: OpenAI client to send the request with
+        image_sources: Local file paths, S3 URLs, or student IDs
+        prefer_local: If True, check for local files first when given a student ID
+        
+    Returns:
+        List of extracted data dictionaries, in the same order as image_sources
+    """
+    content = [
+        {
+            "type": "text",
+            "text": _BATCH_CERT_PROMPT % len(image_sources)
+        }
+    ]
+    
+    for image_source in image_sources:
+        content.append({
+            "type": "image_url",
+            "image_url": {
+                "url": _load_image_data_url(image_source, prefer_local)
+            }
+        })
+    
+    response = client.chat.completions.create(
+        model=VISION_MODEL,
+        messages=[{"role": "user", "content": content}],
+        max_tokens=500 * len(image_sources),
+        response_format={"type": "json_object"},
+        temperature=0,
+        seed=42
+    )
+    
+    results = _parse_json_content(response.choices[0].message.content).get("results", [])
+    if len(results) != len(image_sources):
+        raise ValueError(f"Expected {len(image_sources)} results from vision batch, got {len(results)}")
+    
+    return results
 
 def compare_student_data(student_id: str, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -188,7 +648,105 @@ def compare_student_data(student_id: str, extracted_data: Dict[str, Any]) -> Dic
         Dictionary containing comparison results and anomalies
     """
     # Get student record from MongoDB
-    mongodb_record = get_student_by_id(student_id)
+    return compare_student_record(student_id, get_student_by_id(student_id), extracted_data)
+
+async def compare_student_data_async(student_id: str, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compare MongoDB student data with extracted birth certificate data without blocking the event loop.
+    Args:
+        student_id: Student ID (UUID string) to look up in MongoDB
+        extracted_data: Data extracted from birth certificate
+    Returns:
+        Dictionary containing comparison results and anomalies
+    """
+    return compare_student_record(student_id, await get_student_by_id_async(student_id), extracted_data)
+
+def compare_students_bulk(extracted_by_id: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Compare several students against their extracted birth certificate data,
+    fetching all MongoDB records in one query.
+    
+    Args:
+        extracted_by_id: Extracted certificate data keyed by student ID (UUID string)
+        
+    Returns:
+        List of comparison results, in the same order as extracted_by_id
+    """
+    records = get_students_by_ids(list(extracted_by_id))
+    return [
+        compare_student_record(student_id, records.get(student_id), extracted_data)
+        for student_id, extracted_data in extracted_by_id.items()
+    ]
+
+def validate_students(
+    student_ids: Optional[List[str]] = None,
+    prefer_local: bool = True
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract and compare the birth certificates of many students, overlapping the
+    image downloads, vision requests and MongoDB lookups of different students.
+    Each stage runs on its own thread pool; no records are updated.
+    
+    Args:
+        student_ids: Student IDs (UUID strings) to validate, or None for all students
+        prefer_local: If True, check for local files first
+        
+    Returns:
+        Comparison results keyed by student ID, in the order of student_ids
+    """
+    if student_ids is None:
+        student_ids = get_all_student_ids()
+    
+    def load_image(student_id: str) -> str:
+        source = get_birth_certificate_source(student_id, prefer_local)
+        if not source:
+            raise FileNotFoundError(f"No birth certificate found for student {student_id}")
+        return _load_image_data_url(source, prefer_local)
+    
+    results = {}
+    with ThreadPoolExecutor(PIPELINE_LOAD_WORKERS) as load_pool, \
+            ThreadPoolExecutor(VISION_CONCURRENCY) as vision_pool, \
+            ThreadPoolExecutor(PIPELINE_DB_WORKERS) as db_pool:
+        # Future -> (stage, student_id); finished stages hand over to the next pool
+        pending = {load_pool.submit(load_image, student_id): ("load", student_id) for student_id in student_ids}
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, student_id = pending.pop(future)
+                try:
+                    value = future.result()
+                except Exception as e:
+                    results[student_id] = {"status": "error", "message": f"{stage} failed: {e}"}
+                    continue
+                
+                if stage == "load":
+                    pending[vision_pool.submit(_extract_from_data_url, value)] = ("extract", student_id)
+                elif stage == "extract":
+                    pending[db_pool.submit(compare_student_data, student_id, value)] = ("compare", student_id)
+                else:
+                    results[student_id] = value
+    
+    return {student_id: results[student_id] for student_id in student_ids}
+
+def _normalize_value(value: Any) -> Any:
+    """Normalize a field value for comparison (case-insensitive, strip whitespace)."""
+    return value.strip().casefold() if isinstance(value, str) else value
+
+def compare_student_record(
+    student_id: str,
+    mongodb_record: Optional[Dict[str, Any]],
+    extracted_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Compare a MongoDB student record with extracted birth certificate data.
+    Args:
+        student_id: Student ID (UUID string) the record was looked up by
+        mongodb_record: Student record from MongoDB, or None if not found
+        extracted_data: Data extracted from birth certificate
+    Returns:
+        Dictionary containing comparison results and anomalies
+    """
     if mongodb_record is None:
         return {
             "status": "error",
@@ -203,14 +761,9 @@ def compare_student_data(student_id: str, extracted_data: Dict[str, Any]) -> Dic
     for key, cert_value in extracted_data.items():
         db_value = mongodb_record.get(key)
         if db_value is not None:
-            # Normalize for comparison (case-insensitive, strip whitespace)
-            if isinstance(cert_value, str) and isinstance(db_value, str):
-                cert_val_norm = cert_value.strip().lower()
-                db_val_norm = db_value.strip().lower()
-            else:
-                cert_val_norm = cert_value
-                db_val_norm = db_value
-            if cert_val_norm != db_val_norm:
+            # Identical values match without normalizing; otherwise compare
+            # case-insensitively with surrounding whitespace stripped
+            if cert_value != db_value and _normalize_value(cert_value) != _normalize_value(db_value):
                 anomalies.append({
                     "field": key,
                     "mongodb_value": db_value,
@@ -250,6 +803,19 @@ def update_mongodb_record(student_id: str, updates: Dict[str, Any]) -> Dict[str,
     # Use the update_student function from student_mongodb_tools
     return update_student(student_id, updates)
 
+async def update_mongodb_record_async(student_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Update a student record in MongoDB without blocking the event loop.
+    
+    Args:
+        student_id: Student ID (UUID string) to update
+        updates: Dictionary of field updates
+        
+    Returns:
+        Result of the update operation
+    """
+    return await update_student_async(student_id, updates)
+
 def get_birth_certificate_url(student_id: str) -> Optional[str]:
     """
     Get the S3 URL of a student's birth certificate from MongoDB.
@@ -260,8 +826,22 @@ def get_birth_certificate_url(student_id: str) -> Optional[str]:
     Returns:
         S3 URL of the birth certificate or None if not found
     """
-    student_record = get_student_by_id(student_id)
+    return _birth_certificate_url(get_student_by_id(student_id))
+
+async def get_birth_certificate_url_async(student_id: str) -> Optional[str]:
+    """
+    Get the S3 URL of a student's birth certificate from MongoDB without blocking the event loop.
     
+    Args:
+        student_id: Student ID (UUID string)
+        
+    Returns:
+        S3 URL of the birth certificate or None if not found
+    """
+    return _birth_certificate_url(await get_student_by_id_async(student_id))
+
+def _birth_certificate_url(student_record: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Read the birth certificate S3 URL from a student record."""
     if not student_record:
         return None
     
@@ -291,6 +871,43 @@ def get_birth_certificate_source(student_id: str, prefer_local: bool = True) ->
     # Fall back to S3 URL
     return get_birth_certificate_url(student_id)
 
+async def get_birth_certificate_source_async(student_id: str, prefer_local: bool = True) -> Optional[str]:
+    """
+    Get the birth certificate source for a student without blocking the event loop.
+    Checks local files first if prefer_local is True, then falls back to S3.
+    
+    Args:
+        student_id: Student ID (UUID string)
+        prefer_local: If True, prefer local files over S3
+        
+    Returns:
+        Path to local file or S3 URL, or None if not found
+    """
+    if prefer_local:
+        # The local lookup is an in-memory index hit
+        local_path = get_local_birth_certificate_path(student_id)
+        if local_path:
+            return local_path
+    
+    # Fall back to S3 URL
+    return await get_birth_certificate_url_async(student_id)
+
+def _sniff_image_format(header: bytes) -> Optional[str]:
+    """
+    Detect PNG or JPEG data from its leading magic bytes.
+    
+    Args:
+        header: First bytes of the file
+        
+    Returns:
+        'png' or 'jpeg', or None for any other content
+    """
+    if header.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if header.startswith(b'\xff\xd8\xff'):
+        return 'jpeg'
+    return None
+
 def validate_image_file(image_path: str) -> bool:
     """
     Validate if the provided path is a valid image file or URL.
@@ -301,21 +918,45 @@ def validate_image_file(image_path: str) -> bool:
     Returns:
         True if valid image file/URL, False otherwise
     """
-    # Check if it's a local file
-    if os.path.exists(image_path):
-        try:
-            with Image.open(image_path) as img:
-                return img.format.lower() in ['png', 'jpg', 'jpeg']
-        except:
-            return False
+    # Check if it's a local file; unchanged files are only probed once
+    try:
+        stat = os.stat(image_path)
+    except (OSError, ValueError):
+        stat = None
+    if stat is not None:
+        key = (image_path, stat.st_mtime_ns, stat.st_size)
+        valid = _IMAGE_FILE_CHECKS.get(key)
+        if valid is None:
+            try:
+                with open(image_path, 'rb') as image_file:
+                    valid = _sniff_image_format(image_file.read(12)) is not None
+            except OSError:
+                valid = False
+            if len(_IMAGE_FILE_CHECKS) >= IMAGE_CHECK_CACHE_SIZE:
+                _IMAGE_FILE_CHECKS.clear()
+            _IMAGE_FILE_CHECKS[key] = valid
+        return valid
     
-    # Check if it's a URL
+    # Check if it's a URL, fetching only the first bytes of the image
     if image_path.startswith('http'):
+        now = time.monotonic()
+        entry = _IMAGE_URL_CHECKS.get(image_path)
+        if entry and entry[0] > now:
+            return entry[1]
+        
         try:
-            response = requests.head(image_path)
-            return response.status_code == 200
-        except:
+            with _SESSION.get(image_path, headers={"Range": "bytes=0-11"}, stream=True, timeout=5) as response:
+                valid = (
+                    response.status_code in (200, 206)
+                    and _sniff_image_format(next(response.iter_content(12), b"")) is not None
+                )
+        except Exception:
+            # Network errors are not cached so the next call retries
             return False
+        if len(_IMAGE_URL_CHECKS) >= IMAGE_CHECK_CACHE_SIZE:
+            _IMAGE_URL_CHECKS.clear()
+        _IMAGE_URL_CHECKS[image_path] = (now + IMAGE_URL_CHECK_TTL, valid)
+        return valid
     
     # Check if we can find a local birth certificate for this ID
     local_path = get_local_birth_certificate_path(image_path)
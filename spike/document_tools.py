@@ -1,12 +1,49 @@
 import os
 import base64
-import json
-from typing import Dict, Any, Optional, List
-from PIL import Image
+import orjson
+from typing import Dict, Any, Optional, List, Tuple
 import pandas as pd
 from openai import OpenAI
 from student_tools import get_student_by_id, get_all_student_ids
 
+CSV_PATH = "students.csv"
+
+# Student CSV as last read or written, keyed on the file's (mtime_ns, size)
+_CSV_DF: Optional[pd.DataFrame] = None
+_CSV_FINGERPRINT: Optional[Tuple[int, int]] = None
+# Row label of each student_id in _CSV_DF, first occurrence wins
+_CSV_ROWS: Dict[str, Any] = {}
+# Whether _CSV_DF holds updates not yet written to CSV_PATH
+_CSV_DIRTY = False
+
+# Prompt sent to GPT Vision with each birth certificate
+_BIRTH_CERT_PROMPT = """Please extract the following information from this birth certificate image and return it as a JSON object:
+
+{
+  "name": "Full name as it appears on the certificate",
+  "date_of_birth": "Date of birth in YYYY-MM-DD format",
+  "place_of_birth": "Place of birth",
+  "father_name": "Father's name",
+  "mother_name": "Mother's name",
+  "certificate_number": "Certificate number if available",
+  "registration_date": "Registration date if available in YYYY-MM-DD format"
+}
+
+If any field is not clearly visible or not present, use null for that field. Be very careful to extract the exact text as it appears."""
+
+# Prefix of the data URLs certificates are sent to GPT Vision as
+_DATA_URL_PREFIX = b"data:image/png;base64,"
+
+# OpenAI client, created on first use so its connection pool is reused across calls
+_CLIENT: Optional[OpenAI] = None
+
+def _get_client() -> OpenAI:
+    """Return the shared OpenAI client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _CLIENT
+
 def encode_image_to_base64(image_path: str) -> str:
     """
     Encode an image file to base64 string.
@@ -18,7 +55,13 @@ def encode_image_to_base64(image_path: str) -> str:
         Base64 encoded string of the image
     """
     with open(image_path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode('utf-8')
+        return base64.b64encode(image_file.read()).decode('ascii')
+
+def _image_data_url(image_path: str) -> str:
+    """Encode an image file as a PNG data URL without an intermediate str copy."""
+    with open(image_path, "rb") as image_file:
+        # Base64 output is pure ASCII, so join as bytes and decode once
+        return b"".join([_DATA_URL_PREFIX, base64.b64encode(image_file.read())]).decode('ascii')
 
 def extract_data_from_birth_certificate(image_path: str) -> Dict[str, Any]:
     """
@@ -33,10 +76,10 @@ def extract_data_from_birth_certificate(image_path: str) -> Dict[str, Any]:
     if not os.path.exists(image_path):
         raise FileNotFoundError(f"Image file not found: {image_path}")
     
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    client = _get_client()
     
-    # Encode image to base64
-    base64_image = encode_image_to_base64(image_path)
+    # Encode image as a data URL
+    image_url = _image_data_url(image_path)
     
     try:
         response = client.chat.completions.create(
@@ -47,42 +90,25 @@ def extract_data_from_birth_certificate(image_path: str) -> Dict[str, Any]:
                     "content": [
                         {
                             "type": "text",
-                            "text": """Please extract the following information from this birth certificate image and return it as a JSON object:
-
-{
-  "name": "Full name as it appears on the certificate",
-  "date_of_birth": "Date of birth in YYYY-MM-DD format",
-  "place_of_birth": "Place of birth",
-  "father_name": "Father's name",
-  "mother_name": "Mother's name",
-  "certificate_number": "Certificate number if available",
-  "registration_date": "Registration date if available in YYYY-MM-DD format"
-}
-
-If any field is not clearly visible or not present, use null for that field. Be very careful to extract the exact text as it appears."""
+                            "text": _BIRTH_CERT_PROMPT
                         },
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/png;base64,{base64_image}"
+                                "url": image_url
                             }
                         }
                     ]
                 }
             ],
-            max_tokens=500
+            max_tokens=500,
+            response_format={"type": "json_object"},
+            temperature=0,
+            seed=42
         )
         
-        # Parse the JSON response
-        content = response.choices[0].message.content
-        
-        # Clean up the response to extract JSON
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-        
-        extracted_data = json.loads(content.strip())
+        # JSON mode guarantees the reply is a bare JSON object
+        extracted_data = orjson.loads(response.choices[0].message.content)
         return extracted_data
         
     except Exception as e:
@@ -150,28 +176,84 @@ def compare_student_data(student_id: str, extracted_data: Dict[str, Any]) -> Dic
         "total_anomalies": len(anomalies)
     }
 
-def update_csv_record(student_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+def _csv_fingerprint() -> Tuple[int, int]:
+    """Return the (mtime_ns, size) of CSV_PATH."""
+    stat = os.stat(CSV_PATH)
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _discard_if_changed_on_disk() -> None:
+    """
+    Drop the cached DataFrame if CSV_PATH changed since it was read or written.
+    
+    Raises:
+        RuntimeError: If the file changed while updates were still pending;
+            the pending updates are dropped rather than written over the file
+    """
+    global _CSV_DF, _CSV_DIRTY
+    if _CSV_DF is None or _csv_fingerprint() == _CSV_FINGERPRINT:
+        return
+    
+    pending = _CSV_DIRTY
+    _CSV_DF = None
+    _CSV_DIRTY = False
+    if pending:
+        raise RuntimeError(f"{CSV_PATH} changed on disk while updates were pending; pending updates were discarded")
+
+def _load_csv() -> pd.DataFrame:
+    """
+    Load the student CSV, re-reading it only after the file changes.
+    
+    Returns:
+        Cached DataFrame shared by all CSV updates
+    """
+    global _CSV_DF, _CSV_FINGERPRINT, _CSV_ROWS
+    _discard_if_changed_on_disk()
+    if _CSV_DF is None:
+        fingerprint = _csv_fingerprint()
+        df = pd.read_csv(CSV_PATH, dtype={'student_id': str})
+        
+        rows = {}
+        for label, student_id in zip(df.index, df['student_id']):
+            rows.setdefault(student_id, label)
+        
+        _CSV_DF, _CSV_FINGERPRINT, _CSV_ROWS = df, fingerprint, rows
+    return _CSV_DF
+
+def flush_csv() -> None:
+    """
+    Write pending CSV updates to disk.
+    
+    Raises:
+        RuntimeError: If CSV_PATH changed on disk since it was loaded
+    """
+    global _CSV_DIRTY, _CSV_FINGERPRINT
+    _discard_if_changed_on_disk()
+    if _CSV_DIRTY and _CSV_DF is not None:
+        _CSV_DF.to_csv(CSV_PATH, index=False)
+        _CSV_FINGERPRINT = _csv_fingerprint()
+        _CSV_DIRTY = False
+
+def update_csv_record(student_id: str, updates: Dict[str, Any], flush: bool = True) -> Dict[str, Any]:
     """
     Update a student record in the CSV file.
     
     Args:
         student_id: Student ID to update
         updates: Dictionary of field updates
+        flush: If False, keep the change in memory until flush_csv() is called;
+            use this when applying many updates in a row
         
     Returns:
         Result of the update operation
     """
-    csv_path = "students.csv"
+    global _CSV_DIRTY
     
     try:
-        # Load the CSV
-        df = pd.read_csv(csv_path)
+        df = _load_csv()
         
-        # Find the student record
-        df['student_id'] = df['student_id'].astype(str)
-        student_index = df[df['student_id'] == student_id].index
-        
-        if len(student_index) == 0:
+        # Find the student record by index lookup
+        row = _CSV_ROWS.get(student_id)
+        if row is None:
             return {
                 "status": "error",
                 "message": f"Student ID {student_id} not found in CSV"
@@ -181,16 +263,20 @@ def update_csv_record(student_id: str, updates: Dict[str, Any]) -> Dict[str, Any
         updated_fields = []
         for field, new_value in updates.items():
             if field in df.columns:
-                old_value = df.loc[student_index[0], field]
-                df.loc[student_index[0], field] = new_value
+                old_value = df.at[row, field]
+                df.at[row, field] = new_value
                 updated_fields.append({
                     "field": field,
                     "old_value": old_value,
                     "new_value": new_value
                 })
         
+        if updated_fields:
+            _CSV_DIRTY = True
+        
         # Save the updated CSV
-        df.to_csv(csv_path, index=False)
+        if flush:
+            flush_csv()
         
         return {
             "status": "success",
@@ -217,8 +303,10 @@ def validate_image_file(image_path: str) -> bool:
     if not os.path.exists(image_path):
         return False
     
+    # PIL is only needed here, so load it on first use
+    from PIL import Image
     try:
         with Image.open(image_path) as img:
             return img.format.lower() in ['png', 'jpg', 'jpeg']
     except:
-        return False 
\ No newline at end of file
+        return False
@@ -1,27 +1,145 @@
 import os
+import sys
 import asyncio
-import json
+import io
+import logging
+import queue
+import textwrap
+import threading
+import time
+import traceback
+import orjson
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel
-from agents import Agent, Runner, function_tool, RunContextWrapper
-from student_mongodb_tools import get_student_by_id, validate_student_id_format, get_all_student_ids
+from agents import (
+    Agent, Runner, function_tool, RunContextWrapper,
+    MessageOutputItem, ToolCallItem, ToolCallOutputItem, ItemHelpers
+)
+from student_mongodb_tools import get_student_by_id_async, validate_student_id_format, get_first_n_student_summaries_async, get_first_student_id_async, count_students_async
 from document_mongodb_tools import (
     extract_data_from_birth_certificate,
-    compare_student_data,
-    update_mongodb_record,
-    get_birth_certificate_url,
-    get_birth_certificate_source,
+    compare_student_record,
+    update_mongodb_record_async,
+    get_birth_certificate_source_async,
     validate_image_file
 )
 
 from dotenv import load_dotenv
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Seconds a fetched student record is reused before re-querying MongoDB
+STUDENT_CACHE_TTL = 60.0
+STUDENT_CACHE_SIZE = 512
+
+# student_id -> (expiry, record), least recently used first
+_student_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+# Fallback student for STU### test IDs, looked up once per process
+_first_student_id: Optional[str] = None
+
+async def _cached_student(student_id: str) -> Optional[Dict[str, Any]]:
+    """Fetch a student record, reusing a recent lookup of the same ID."""
+    now = time.monotonic()
+    entry = _student_cache.get(student_id)
+    if entry and entry[0] > now:
+        _student_cache.move_to_end(student_id)
+        return entry[1]
+    
+    student_record = await get_student_by_id_async(student_id)
+    # Only found records are cached, so newly created students show up immediately
+    if student_record is not None:
+        _student_cache[student_id] = (now + STUDENT_CACHE_TTL, student_record)
+        _student_cache.move_to_end(student_id)
+        if len(_student_cache) > STUDENT_CACHE_SIZE:
+            _student_cache.popitem(last=False)
+    else:
+        _student_cache.pop(student_id, None)
+    return student_record
+
+async def _cached_first_student_id() -> Optional[str]:
+    """Get the UUID used in place of STU### test IDs, querying MongoDB only once."""
+    global _first_student_id
+    if _first_student_id is None:
+        _first_student_id = await get_first_student_id_async()
+    return _first_student_id
+
+def _invalidate_student(student_id: str) -> None:
+    """Drop cached data for a student after it was updated."""
+    _student_cache.pop(student_id, None)
+
 # Enhanced context for the validation agent
 class EnhancedValidationContext(BaseModel):
     last_student_id: str | None = None
     pending_updates: dict | None = None
     document_data: dict | None = None
 
+def _pending_updates(comparison_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Map each anomalous field to its certificate value, ready for approve_mongodb_updates."""
+    return {anomaly['field']: anomaly['certificate_value'] for anomaly in comparison_result["anomalies"]}
+
+def _format_comparison_report(
+    student_id: str,
+    source_lines: str,
+    extracted_data: Dict[str, Any],
+    comparison_result: Dict[str, Any]
+) -> str:
+    """
+    Format the result of comparing a birth certificate with a MongoDB record.
+    
+    Args:
+        student_id: Student ID (UUID) the certificate was compared against
+        source_lines: Report lines describing where the certificate came from
+        extracted_data: Data extracted from the birth certificate
+        comparison_result: Successful result of compare_student_record
+        
+    Returns:
+        Human-readable comparison report
+    """
+    mongodb_record = comparison_result['mongodb_record']
+    parts = [f"""
+    Document Processing Results:
+    ===========================
+
+    Student ID: {student_id}
+    {source_lines}
+
+    EXTRACTED FROM BIRTH CERTIFICATE:
+    {orjson.dumps(extracted_data, option=orjson.OPT_INDENT_2).decode()}
+
+    MONGODB RECORD:
+    Name: {mongodb_record.get('name', 'N/A')}
+    First Name: {mongodb_record.get('first_name', 'N/A')}
+    Last Name: {mongodb_record.get('last_name', 'N/A')}
+    Birthdate: {mongodb_record.get('birthdate', 'N/A')}
+
+    COMPARISON RESULTS:
+    """]
+    
+    if comparison_result["matches"]:
+        parts.append("\n✅ MATCHES:\n")
+        for match in comparison_result["matches"]:
+            parts.append(f"   • {match['field']}: {match['value']}\n")
+    
+    if comparison_result["anomalies"]:
+        parts.append(f"\n⚠️  ANOMALIES DETECTED ({len(comparison_result['anomalies'])}):\n")
+        for anomaly in comparison_result["anomalies"]:
+            parts.append(f"   • {anomaly['field']}:\n")
+            parts.append(f"     MongoDB: '{anomaly['mongodb_value']}'\n")
+            parts.append(f"     Certificate: '{anomaly['certificate_value']}'\n")
+        
+        parts.append("\n📝 Would you like me to update MongoDB with the certificate data? Say 'yes' to approve updates.")
+    else:
+        parts.append("\n✅ No anomalies detected! MongoDB data matches the birth certificate.")
+    
+    if comparison_result["additional_info"]:
+        parts.append("\n📄 ADDITIONAL CERTIFICATE INFO:\n")
+        for key, value in comparison_result["additional_info"].items():
+            parts.append(f"   • {key}: {value}\n")
+    
+    return "".join(parts)
+
 # Enhanced tool functions using the proper decorator
 @function_tool
 async def fetch_student_record(student_id: str) -> str:
@@ -34,28 +152,23 @@ async def fetch_student_record(student_id: str) -> str:
     Returns:
         Formatted string with student information or error message
     """
-    print(f"DEBUG: fetch_student_record called with student_id: {student_id}")
+    logger.debug("fetch_student_record called with student_id: %s", student_id)
     
     # Validate format first
     if not validate_student_id_format(student_id):
-        print(f"DEBUG: Invalid student ID format: {student_id}")
+        logger.debug("Invalid student ID format: %s", student_id)
         return f"Invalid student ID format: {student_id}. Expected format: Valid UUID (e.g., 1ef47dda-5884-422b-b84b-2ee3d119b0c7)"
     
-    print(f"DEBUG: Student ID format is valid")
-    
     # Fetch the record
-    print(f"DEBUG: Calling get_student_by_id...")
-    student_record = get_student_by_id(student_id)
-    print(f"DEBUG: get_student_by_id returned: {student_record}")
+    student_record = await _cached_student(student_id)
+    logger.debug("get_student_by_id returned: %s", student_record)
     
     if student_record is None:
-        print(f"DEBUG: Student record is None, getting available IDs...")
-        available_ids = get_all_student_ids()
-        print(f"DEBUG: Available IDs: {available_ids}")
+        # One extra ID tells whether the list was cut short
+        available_ids = [available_id for available_id, _ in await get_first_n_student_summaries_async(6)]
+        logger.debug("Student %s not found, available IDs: %s", student_id, available_ids)
         return f"Student ID {student_id} not found. Available student IDs: {', '.join(available_ids[:5])}{'...' if len(available_ids) > 5 else ''}"
     
-    print(f"DEBUG: Student record found, formatting...")
-    
     # Format the record nicely
     formatted_record = f"""
     Student Record Found:
@@ -72,60 +185,43 @@ async def fetch_student_record(student_id: str) -> str:
     Has Birth Certificate: {'Yes' if student_record.get('documents', {}).get('birth_certificate') else 'No'}
     ====================
     """
-    print(f"DEBUG: Returning formatted record")
     return formatted_record
 
-@function_tool
-async def process_birth_certificate(
-    context: RunContextWrapper[EnhancedValidationContext], 
+async def _run_certificate_pipeline(
+    context: RunContextWrapper[EnhancedValidationContext],
     student_id: str,
-    use_stu_format: bool = False
+    source: str,
+    source_lines: str
 ) -> str:
     """
-    Process a birth certificate image and compare with student data.
-    Checks local files first (in spike/docs/), then falls back to S3 if not found.
+    Extract a birth certificate, compare it with MongoDB and stash the pending updates.
     
     Args:
         student_id: The student ID (UUID or STU### format) to compare against
-        use_stu_format: If True, will look for STU### format files in docs folder
+        source: Local path, URL or certificate ID of the birth certificate image
+        source_lines: Report lines describing where the certificate came from
         
     Returns:
         Comparison results and anomaly report
     """
-    # For testing with local files, we can accept STU### format
-    if use_stu_format or student_id.startswith("STU"):
-        # Use the STU format directly for local file lookup
-        birth_cert_source = f"docs/{student_id}.png"
-    else:
-        # Validate UUID format
-        if not validate_student_id_format(student_id):
-            return f"Invalid student ID format: {student_id}. Expected format: Valid UUID or STU###"
-        
-        # Get birth certificate source (local file or S3 URL)
-        birth_cert_source = get_birth_certificate_source(student_id, prefer_local=True)
-        
-        if not birth_cert_source:
-            # If no source found, check if we can find a local STU file
-            # This is a temporary workaround for testing
-            birth_cert_source = "STU001"  # Default to STU001 for testing
-    
     try:
-        # Extract data from birth certificate using GPT Vision
-        extracted_data = extract_data_from_birth_certificate(birth_cert_source, prefer_local=True)
-        
         # For comparison, we need the actual MongoDB student ID (UUID)
         # If we used STU format, try to find the corresponding UUID
         comparison_student_id = student_id
         if student_id.startswith("STU"):
             # For testing, we'll use the first available student
-            available_students = get_all_student_ids()
-            if available_students:
-                comparison_student_id = available_students[0].split(' ')[0]  # Extract UUID
-            else:
+            comparison_student_id = await _cached_first_student_id()
+            if not comparison_student_id:
                 return "No students found in MongoDB for comparison"
         
+        # Extract data from birth certificate using GPT Vision while the MongoDB record loads
+        extracted_data, student_record = await asyncio.gather(
+            asyncio.to_thread(extract_data_from_birth_certificate, source),
+            _cached_student(comparison_student_id)
+        )
+        
         # Compare with MongoDB data
-        comparison_result = compare_student_data(comparison_student_id, extracted_data)
+        comparison_result = compare_student_record(comparison_student_id, student_record, extracted_data)
         
         if comparison_result["status"] == "error":
             return comparison_result["message"]
@@ -134,57 +230,57 @@ async def process_birth_certificate(
         context.context.last_student_id = comparison_student_id
         context.context.document_data = extracted_data
         
+        # Store potential updates
+        if comparison_result["anomalies"]:
+            context.context.pending_updates = _pending_updates(comparison_result)
+        
         # Format the comparison report
-        report = f"""
-    Document Processing Results:
-    ===========================
-
-    Student ID: {comparison_student_id}
-    Birth Certificate Source: {birth_cert_source}
-    Source Type: {'Local File' if not birth_cert_source.startswith('http') else 'S3 URL'}
-
-    EXTRACTED FROM BIRTH CERTIFICATE:
-    {json.dumps(extracted_data, indent=2)}
-
-    MONGODB RECORD:
-    Name: {comparison_result['mongodb_record'].get('name', 'N/A')}
-    First Name: {comparison_result['mongodb_record'].get('first_name', 'N/A')}
-    Last Name: {comparison_result['mongodb_record'].get('last_name', 'N/A')}
-    Birthdate: {comparison_result['mongodb_record'].get('birthdate', 'N/A')}
+        return _format_comparison_report(comparison_student_id, source_lines, extracted_data, comparison_result)
+        
+    except Exception as e:
+        return f"Error processing birth certificate: {e}"
 
-    COMPARISON RESULTS:
+@function_tool
+async def process_birth_certificate(
+    context: RunContextWrapper[EnhancedValidationContext], 
+    student_id: str,
+    use_stu_format: bool = False
+) -> str:
     """
+    Process a birth certificate image and compare with student data.
+    Checks local files first (in spike/docs/), then falls back to S3 if not found.
+    
+    Args:
+        student_id: The student ID (UUID or STU### format) to compare against
+        use_stu_format: If True, will look for STU### format files in docs folder
         
-        if comparison_result["matches"]:
-            report += "\n✅ MATCHES:\n"
-            for match in comparison_result["matches"]:
-                report += f"   • {match['field']}: {match['value']}\n"
-        
-        if comparison_result["anomalies"]:
-            report += f"\n⚠️  ANOMALIES DETECTED ({len(comparison_result['anomalies'])}):\n"
-            context.context.pending_updates = {}
-            
-            for anomaly in comparison_result["anomalies"]:
-                report += f"   • {anomaly['field']}:\n"
-                report += f"     MongoDB: '{anomaly['mongodb_value']}'\n"
-                report += f"     Certificate: '{anomaly['certificate_value']}'\n"
-                
-                # Store potential update
-                context.context.pending_updates[anomaly['field']] = anomaly['certificate_value']
-            
-            report += "\n📝 Would you like me to update MongoDB with the certificate data? Say 'yes' to approve updates."
-        else:
-            report += "\n✅ No anomalies detected! MongoDB data matches the birth certificate."
-        
-        if comparison_result["additional_info"]:
-            report += "\n📄 ADDITIONAL CERTIFICATE INFO:\n"
-            for key, value in comparison_result["additional_info"].items():
-                report += f"   • {key}: {value}\n"
+    Returns:
+        Comparison results and anomaly report
+    """
+    # For testing with local files, we can accept STU### format
+    if use_stu_format or student_id.startswith("STU"):
+        # Use the STU format directly for local file lookup
+        birth_cert_source = f"docs/{student_id}.png"
+    else:
+        # Validate UUID format
+        if not validate_student_id_format(student_id):
+            return f"Invalid student ID format: {student_id}. Expected format: Valid UUID or STU###"
         
-        return report
+        # Get birth certificate source (local file or S3 URL)
+        birth_cert_source = await get_birth_certificate_source_async(student_id, prefer_local=True)
         
-    except Exception as e:
-        return f"Error processing birth certificate: {e}"
+        if not birth_cert_source:
+            # If no source found, check if we can find a local STU file
+            # This is a temporary workaround for testing
+            birth_cert_source = "STU001"  # Default to STU001 for testing
+    
+    source_type = 'Local File' if not birth_cert_source.startswith('http') else 'S3 URL'
+    return await _run_certificate_pipeline(
+        context,
+        student_id,
+        birth_cert_source,
+        f"Birth Certificate Source: {birth_cert_source}\n    Source Type: {source_type}"
+    )
 
 @function_tool
 async def approve_mongodb_updates(context: RunContextWrapper[EnhancedValidationContext]) -> str:
@@ -199,25 +295,26 @@ async def approve_mongodb_updates(context: RunContextWrapper[EnhancedValidationC
     
     try:
         # Apply the updates
-        import pdb; pdb.set_trace()
-        result = update_mongodb_record(context.context.last_student_id, context.context.pending_updates)
+        result = await update_mongodb_record_async(context.context.last_student_id, context.context.pending_updates)
         
         if result["status"] == "success":
+            _invalidate_student(context.context.last_student_id)
+            
             # Clear pending updates
             updates_made = context.context.pending_updates.copy()
             context.context.pending_updates = None
             
-            report = f"""
+            parts = [f"""
     ✅ MONGODB UPDATE SUCCESSFUL!
 
     Student ID: {context.context.last_student_id}
     Updated Fields:
-    """
+    """]
             for field, new_value in updates_made.items():
-                report += f"   • {field}: {new_value}\n"
+                parts.append(f"   • {field}: {new_value}\n")
             
-            report += f"\n{result['message']}"
-            return report
+            parts.append(f"\n{result['message']}")
+            return "".join(parts)
         else:
             return f"❌ Update failed: {result['message']}"
             
@@ -232,20 +329,25 @@ async def list_available_students() -> str:
     Returns:
         Formatted string with all available student IDs
     """
-    student_ids = get_all_student_ids()
-    if not student_ids:
+    # Limit to the first 20, fetching one more to tell whether there are others
+    students = await get_first_n_student_summaries_async(21)
+    if not students:
         return "No student records found in MongoDB."
     
     # Format the list nicely
-    report = "Available Students in MongoDB:\n"
-    report += "==============================\n"
-    for idx, student_info in enumerate(student_ids[:20], 1):  # Limit to first 20
-        report += f"{idx}. {student_info}\n"
-    
-    if len(student_ids) > 20:
-        report += f"\n... and {len(student_ids) - 20} more students"
+    parts = ["Available Students in MongoDB:\n", "==============================\n"]
+    for idx, (student_id, name) in enumerate(students[:20], 1):
+        parts.append(f"{idx}. {student_id} ({name})\n")
+    
+    # Only count the full collection when the list was actually truncated
+    if len(students) > 20:
+        remaining = await count_students_async() - 20
+        if remaining > 0:
+            parts.append(f"\n... and {remaining} more students")
+        else:
+            parts.append("\n... and more students")
     
-    return report
+    return "".join(parts)
 
 @function_tool
 async def process_birth_certificate_by_url(
@@ -267,88 +369,14 @@ async def process_birth_certificate_by_url(
     if not validate_student_id_format(student_id) and not student_id.startswith("STU"):
         return f"Invalid student ID format: {student_id}. Expected format: Valid UUID or STU###"
     
-    if not validate_image_file(image_url):
+    # URLs are probed over the network, so keep the check off the event loop
+    if not await asyncio.to_thread(validate_image_file, image_url):
         return f"Invalid or inaccessible image: {image_url}"
     
-    try:
-        # Extract data from birth certificate using GPT Vision
-        extracted_data = extract_data_from_birth_certificate(image_url)
-        
-        # For comparison, we need the actual MongoDB student ID (UUID)
-        comparison_student_id = student_id
-        if student_id.startswith("STU"):
-            # For testing, we'll use the first available student
-            available_students = get_all_student_ids()
-            if available_students:
-                comparison_student_id = available_students[0].split(' ')[0]  # Extract UUID
-            else:
-                return "No students found in MongoDB for comparison"
-        
-        # Compare with MongoDB data
-        comparison_result = compare_student_data(comparison_student_id, extracted_data)
-        
-        if comparison_result["status"] == "error":
-            return comparison_result["message"]
-        
-        # Store results in context for potential updates
-        context.context.last_student_id = comparison_student_id
-        context.context.document_data = extracted_data
-        
-        # Format the comparison report (similar to process_birth_certificate)
-        report = f"""
-    Document Processing Results:
-    ===========================
-
-    Student ID: {comparison_student_id}
-    Custom Image Path: {image_url}
-
-    EXTRACTED FROM BIRTH CERTIFICATE:
-    {json.dumps(extracted_data, indent=2)}
+    return await _run_certificate_pipeline(context, student_id, image_url, f"Custom Image Path: {image_url}")
 
-    MONGODB RECORD:
-    Name: {comparison_result['mongodb_record'].get('name', 'N/A')}
-    First Name: {comparison_result['mongodb_record'].get('first_name', 'N/A')}
-    Last Name: {comparison_result['mongodb_record'].get('last_name', 'N/A')}
-    Birthdate: {comparison_result['mongodb_record'].get('birthdate', 'N/A')}
-
-    COMPARISON RESULTS:
-    """
-        
-        if comparison_result["matches"]:
-            report += "\n✅ MATCHES:\n"
-            for match in comparison_result["matches"]:
-                report += f"   • {match['field']}: {match['value']}\n"
-        
-        if comparison_result["anomalies"]:
-            report += f"\n⚠️  ANOMALIES DETECTED ({len(comparison_result['anomalies'])}):\n"
-            context.context.pending_updates = {}
-            
-            for anomaly in comparison_result["anomalies"]:
-                report += f"   • {anomaly['field']}:\n"
-                report += f"     MongoDB: '{anomaly['mongodb_value']}'\n"
-                report += f"     Certificate: '{anomaly['certificate_value']}'\n"
-                
-                # Store potential update
-                context.context.pending_updates[anomaly['field']] = anomaly['certificate_value']
-            
-            report += "\n📝 Would you like me to update MongoDB with the certificate data? Say 'yes' to approve updates."
-        else:
-            report += "\n✅ No anomalies detected! MongoDB data matches the birth certificate."
-        
-        if comparison_result["additional_info"]:
-            report += "\n📄 ADDITIONAL CERTIFICATE INFO:\n"
-            for key, value in comparison_result["additional_info"].items():
-                report += f"   • {key}: {value}\n"
-        
-        return report
-        
-    except Exception as e:
-        return f"Error processing birth certificate: {e}"
-
-# Create the enhanced validation agent
-enhanced_validation_agent = Agent[EnhancedValidationContext](
-    name="Enhanced Student Validation Agent (MongoDB + Local Files)",
-    instructions="""
+# Agent instructions, dedented once at import so no indentation is sent with every run
+AGENT_INSTRUCTIONS = textwrap.dedent("""
     You are an enhanced student validation agent with MongoDB integration and local file support. Your role is to:
     
     1. **Student Record Lookup**: Fetch student records from MongoDB by UUID
@@ -398,12 +426,99 @@ enhanced_validation_agent = Agent[EnhancedValidationContext](
     - Handle errors gracefully and provide helpful guidance
     
     Be conversational, professional, and thorough in your responses.
-    """,
+    """).strip()
+
+# Create the enhanced validation agent
+enhanced_validation_agent = Agent[EnhancedValidationContext](
+    name="Enhanced Student Validation Agent (MongoDB + Local Files)",
+    instructions=AGENT_INSTRUCTIONS,
     tools=[fetch_student_record, process_birth_certificate, approve_mongodb_updates, list_available_students, process_birth_certificate_by_url]
 )
 
+# Inputs that end the REPL session
+_QUIT_CMDS = frozenset({"quit", "exit", "q"})
+
+# Conversation items replayed to the model each turn; older turns are dropped
+CONVERSATION_HISTORY_LIMIT = int(os.getenv("CONVERSATION_HISTORY_LIMIT", "40"))
+
+# Prompts waiting for the stdin reader thread, which is started on first use
+_INPUT_REQUESTS: "queue.SimpleQueue[Tuple[str, asyncio.AbstractEventLoop, asyncio.Future]]" = queue.SimpleQueue()
+_input_thread: Optional[threading.Thread] = None
+
+def _trim_history(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Keep roughly the last CONVERSATION_HISTORY_LIMIT conversation items.
+    
+    The kept history always starts at a user message, so tool calls are never
+    separated from their outputs (the API rejects orphaned tool outputs).
+    """
+    if len(items) <= CONVERSATION_HISTORY_LIMIT:
+        return items
+    
+    user_turns = [idx for idx, item in enumerate(items) if item.get("role") == "user"]
+    if not user_turns:
+        return items
+    
+    cutoff = len(items) - CONVERSATION_HISTORY_LIMIT
+    start = next((idx for idx in user_turns if idx >= cutoff), user_turns[-1])
+    return items[start:]
+
+def _settle_input(line: asyncio.Future, text: Optional[str], error: Optional[BaseException]) -> None:
+    """Resolve a pending prompt on the event loop, unless it was already cancelled."""
+    if line.done():
+        return
+    if error is not None:
+        line.set_exception(error)
+    else:
+        line.set_result(text)
+
+def _input_worker() -> None:
+    """Answer prompt requests one at a time for the lifetime of the process."""
+    # On a terminal input() reads through PyOS_Readline, keeping line editing and
+    # history, and holds no lock on sys.stdin. Piped input would go through
+    # sys.stdin.readline(), whose lock a daemon thread still blocked at Ctrl+C keeps
+    # through interpreter shutdown, so it is read via a private text reader on the
+    # same descriptor instead; nothing else in the agent reads sys.stdin.
+    interactive = sys.stdin.isatty() and sys.stdout.isatty()
+    stream = None
+    if not interactive:
+        stream = io.open(sys.stdin.fileno(), "r", encoding=sys.stdin.encoding, errors="replace", closefd=False)
+    
+    while True:
+        prompt, loop, line = _INPUT_REQUESTS.get()
+        text, error = None, None
+        try:
+            if interactive:
+                text = input(prompt)
+            else:
+                print(prompt, end="", flush=True)
+                text = stream.readline()
+                if not text:
+                    raise EOFError()
+                text = text.rstrip("\r\n")
+        except Exception as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(_settle_input, line, text, error)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+async def _read_input(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop."""
+    global _input_thread
+    if _input_thread is None:
+        _input_thread = threading.Thread(target=_input_worker, name="stdin-reader", daemon=True)
+        _input_thread.start()
+    
+    loop = asyncio.get_running_loop()
+    line = loop.create_future()
+    _INPUT_REQUESTS.put((prompt, loop, line))
+    return await line
+
 async def main():
     """Main function to run the enhanced validation agent."""
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+    
     # Check if OpenAI API key is set
     if not os.getenv("OPENAI_API_KEY"):
         print("Warning: OPENAI_API_KEY environment variable not set.")
@@ -444,9 +559,9 @@ async def main():
     
     while True:
         try:
-            user_input = input("Stakeholder: ").strip()
+            user_input = (await _read_input("Stakeholder: ")).strip()
             
-            if user_input.lower() in ['quit', 'exit', 'q']:
+            if user_input.lower() in _QUIT_CMDS:
                 print("Thank you for using the Enhanced Student Validation Agent!")
                 break
             
@@ -460,8 +575,6 @@ async def main():
             result = await Runner.run(enhanced_validation_agent, input_items, context=context)
             
             # Get the final response - using the same pattern as the airline example
-            from agents import MessageOutputItem, ToolCallItem, ToolCallOutputItem, ItemHelpers
-            
             for new_item in result.new_items:
                 agent_name = new_item.agent.name
                 if isinstance(new_item, MessageOutputItem):
@@ -474,16 +587,15 @@ async def main():
                 else:
                     print(f"{agent_name}: {new_item.__class__.__name__}")
             
-            # Update input items for next iteration
-            input_items = result.to_input_list()
+            # Update input items for next iteration, bounding the replayed history
+            input_items = _trim_history(result.to_input_list())
             print()
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError, EOFError):
             print("\nGoodbye!")
             break
         except Exception as e:
             print(f"Error: {e}")
-            import traceback
             traceback.print_exc()
 
 if __name__ == "__main__":
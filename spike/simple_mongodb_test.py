@@ -10,7 +10,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
 load_dotenv()
 
-from pymongo import MongoClient
+from api.database import DatabaseConnection
 
 def simple_mongodb_test():
     """Simple test to check MongoDB connection and structure."""
@@ -29,12 +29,9 @@ def simple_mongodb_test():
         return
     
     try:
-        # Connect to MongoDB
+        # Connect to MongoDB through the shared, pooled client (connect() pings it)
         print("\n1. Connecting to MongoDB...")
-        client = MongoClient(mongodb_uri, serverSelectionTimeoutMS=5000)
-        
-        # Test connection
-        client.admin.command('ping')
+        client = DatabaseConnection.get_instance().connect()
         print("✅ MongoDB connection successful!")
         
         # List all databases
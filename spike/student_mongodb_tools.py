@@ -2,34 +2,121 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from typing import Optional, Dict, Any, List
-from api.database import get_enrollment_collection
+from typing import Optional, Dict, Any, List, Tuple
+from api.database import get_enrollment_collection, get_async_enrollment_collection
 import logging
-from bson import Binary
+import re
 import uuid
+from functools import lru_cache
+from bson import Binary
 
 logger = logging.getLogger(__name__)
 
-def binary_to_uuid_string(binary_obj) -> str:
+# Canonical 8-4-4-4-12 hex UUID, as stored in uuid_str
+_UUID_RE = re.compile(r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z")
+
+# Flat student record fields, projected server-side from an unwound students_info entry;
+# medical, caregiver and other student data stay on the server
+_STUDENT_RECORD_FIELDS = {
+    "uuid_str": 1,
+    "email": 1,
+    "phone": 1,
+    "first_name": "$students_info.first_name",
+    "last_name": "$students_info.last_name",
+    "birthdate": "$students_info.birthdate",
+    "gender": "$students_info.gender",
+    "address": "$students_info.address",
+    "applying_grade": "$students_info.application_info.applyingGrade",
+    "documents": "$students_info.documents",
+}
+
+# Fields stored on the enrollment document itself
+_PARENT_FIELDS = {"email", "phone"}
+
+# Map our simplified field names to the actual MongoDB structure
+_STUDENT_FIELD_MAPPING = {
+    'first_name': 'students_info.$.first_name',
+    'last_name': 'students_info.$.last_name',
+    'birthdate': 'students_info.$.birthdate',
+    'gender': 'students_info.$.gender',
+    'address': 'students_info.$.address',
+    'has_mailing_address': 'students_info.$.has_mailing_address',
+    'mailing_address': 'students_info.$.mailing_address',
+    'info_status': 'students_info.$.info_status',
+    'step_completed': 'students_info.$.step_completed',
+    'created_at': 'students_info.$.created_at',
+    'updated_at': 'students_info.$.updated_at',
+    'application_info': 'students_info.$.application_info',
+    'medical_info': 'students_info.$.medical_info',
+    'care_giver_info': 'students_info.$.care_giver_info',
+    'special_assistance_info': 'students_info.$.special_assistance_info',
+    'documents': 'students_info.$.documents',
+}
+
+def _student_id_str(value) -> str:
     """
-    Convert a Binary UUID object to a string UUID.
+    Format a students_info id as a UUID string.
     
     Args:
-        binary_obj: Binary UUID object from MongoDB
+        value: uuid.UUID for standard (subtype 4) ids, or bson.Binary for
+            legacy subtype 3 ids the standard representation leaves undecoded
         
     Returns:
         String representation of the UUID
     """
-    try:
-        if isinstance(binary_obj, Binary):
-            # For Binary objects, we can access the bytes directly
-            return str(uuid.UUID(bytes=binary_obj))
-        else:
-            # If it's already a string or other format
-            return str(binary_obj)
-    except Exception as e:
-        logger.error(f"Error converting Binary to UUID string: {e}")
+    if isinstance(value, Binary):
+        return str(uuid.UUID(bytes=bytes(value)))
+    return str(value)
+
+
+def _student_record_pipeline(match: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Build the aggregation returning one flat document per matching student.
+    
+    Args:
+        match: Filter on the enrollment documents
+        limit: Maximum number of students to return, or None for all
+        
+    Returns:
+        Aggregation pipeline
+    """
+    pipeline = [{"$match": match}, {"$unwind": "$students_info"}]
+    if limit is not None:
+        pipeline.append({"$limit": limit})
+    pipeline.append({"$project": _STUDENT_RECORD_FIELDS})
+    return pipeline
+
+
+def _build_student_record(student_id: str, student: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Build a flat student record from a _student_record_pipeline document.
+    
+    Args:
+        student_id: The student ID (UUID string) the document was looked up by
+        student: Projected student document, or None if it was not found
+        
+    Returns:
+        Dictionary containing student information, or None if there is no student
+    """
+    if not student:
         return None
+    
+    first_name = student.get('first_name', '')
+    last_name = student.get('last_name', '')
+    return {
+        'student_id': student_id,
+        'first_name': first_name,
+        'last_name': last_name,
+        'name': f"{first_name} {last_name}".strip(),
+        'email': student.get('email', ''),
+        'phone': student.get('phone', ''),
+        'birthdate': student.get('birthdate', ''),
+        'gender': student.get('gender', ''),
+        'address': student.get('address', {}),
+        'applying_grade': student.get('applying_grade', ''),
+        'documents': student.get('documents', {}),
+        'parent_doc_id': str(student.get('_id', ''))
+    }
 
 
 def get_student_by_id(student_id: str) -> Optional[Dict[str, Any]]:
@@ -43,48 +130,76 @@ def get_student_by_id(student_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary containing student information if found, None otherwise
     """
-    print(f"DEBUG: get_student_by_id called with student_id: {student_id}")
+    logger.debug("get_student_by_id called with student_id: %s", student_id)
     
     try:
-        print(f"DEBUG: Getting enrollment collection...")
         collection = get_enrollment_collection()
-        print(f"DEBUG: Collection obtained successfully")
-        
-        parent_doc = collection.find_one({
-            "uuid_str": student_id
-        })
-        
-        if parent_doc and 'students_info' in parent_doc:
-            # Find the specific student within the array
-            for i, student in enumerate(parent_doc['students_info']):
-                
-                student_record = {
-                    'student_id': student_id,
-                    'first_name': student.get('first_name', ''),
-                    'last_name': student.get('last_name', ''),
-                    'name': f"{student.get('first_name', '')} {student.get('last_name', '')}".strip(),
-                    'email': parent_doc.get('email', ''),
-                    'phone': parent_doc.get('phone', ''),
-                    'birthdate': student.get('birthdate', ''),
-                    'gender': student.get('gender', ''),
-                    'address': student.get('address', {}),
-                    'applying_grade': student.get('application_info', {}).get('applyingGrade', ''),
-                    'documents': student.get('documents', {}),
-                    'parent_doc_id': str(parent_doc.get('_id', ''))
-                }
-                print(f"DEBUG: ✅ Returning student record for: {student_record['name']}")
-                return student_record
-    
-        print(f"DEBUG: ❌ Student {student_id} not found in any document")
+        
+        # Only the first student of the enrollment is returned, already flattened
+        cursor = collection.aggregate(_student_record_pipeline({"uuid_str": student_id}, limit=1))
+        
+        student_record = _build_student_record(student_id, next(cursor, None))
+        if student_record:
+            logger.debug("Returning student record for: %s", student_record['name'])
+            return student_record
+    
+        logger.debug("Student %s not found in any document", student_id)
         return None
         
     except Exception as e:
-        print(f"DEBUG: ❌ Exception in get_student_by_id: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error fetching student %s: %s", student_id, e)
         return None
 
 
+async def get_student_by_id_async(student_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch student record by ID from MongoDB without blocking the event loop.
+    
+    Args:
+        student_id: The student ID (UUID string) to search for
+        
+    Returns:
+        Dictionary containing student information if found, None otherwise
+    """
+    try:
+        collection = get_async_enrollment_collection()
+        students = await collection.aggregate(
+            _student_record_pipeline({"uuid_str": student_id}, limit=1)
+        ).to_list(length=1)
+        return _build_student_record(student_id, students[0] if students else None)
+        
+    except Exception as e:
+        logger.error(f"Error fetching student {student_id}: {e}")
+        return None
+
+
+def get_students_by_ids(student_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch several student records from MongoDB in a single query.
+    
+    Args:
+        student_ids: Student IDs (UUID strings) to look up
+        
+    Returns:
+        Dictionary mapping each found student ID to its student record
+    """
+    try:
+        collection = get_enrollment_collection()
+        
+        # One $in aggregation on the indexed uuid_str instead of a round-trip per student
+        students = {}
+        for student in collection.aggregate(_student_record_pipeline({"uuid_str": {"$in": list(student_ids)}})):
+            # Keep the first student of each enrollment, as the single lookup does
+            if student['uuid_str'] not in students:
+                students[student['uuid_str']] = _build_student_record(student['uuid_str'], student)
+        
+        return students
+        
+    except Exception as e:
+        logger.error(f"Error fetching students by IDs: {e}")
+        return {}
+
+
 def validate_uuid_format(student_id: str) -> bool:
     """
     Validate if the provided string is a valid UUID.
@@ -95,12 +210,9 @@ def validate_uuid_format(student_id: str) -> bool:
     Returns:
         True if valid UUID format, False otherwise
     """
-    try:
-        uuid.UUID(student_id)
-        return True
-    except (ValueError, AttributeError):
-        return False
+    return isinstance(student_id, str) and _UUID_RE.match(student_id) is not None
 
+@lru_cache(maxsize=4096)
 def validate_student_id_format(student_id: str) -> bool:
     """
     Validate if student ID is either a valid UUID or follows STU### format.
@@ -128,36 +240,220 @@ def get_all_student_ids() -> List[str]:
     Get list of all available student IDs from MongoDB.
     
     Returns:
-        List of all student IDs (UUIDs as strings)
+        Sorted list of all student IDs (UUIDs as strings)
     """
     try:
         collection = get_enrollment_collection()
+        students = collection.aggregate(_students_pipeline(names=False), allowDiskUse=True)
+        return [summary[0] for summary in _student_summaries(students)]
         
-        # Get all enrollment documents
-        all_students = []
-        
-        for doc in collection.find({}, {"students_info.id": 1, "students_info.first_name": 1, "students_info.last_name": 1}):
-            if 'students_info' in doc:
-                for student in doc['students_info']:
-                    student_id_binary = student.get('id')
-                    if student_id_binary:
-                        # Convert Binary UUID to string
-                        student_uuid_str = binary_to_uuid_string(student_id_binary)
-                        
-                        if student_uuid_str:
-                            # Include name for better identification
-                            first_name = student.get('first_name', '')
-                            last_name = student.get('last_name', '')
-                            display_name = f"{student_uuid_str} ({first_name} {last_name})".strip()
-                            
-                            all_students.append(display_name)
-        
-        return sorted(all_students)
+    except Exception as e:
+        logger.error(f"Error reading student IDs from MongoDB: {e}")
+        return []
+
+async def get_all_student_ids_async() -> List[str]:
+    """
+    Get list of all available student IDs from MongoDB without blocking the event loop.
+    
+    Returns:
+        Sorted list of all student IDs (UUIDs as strings)
+    """
+    try:
+        collection = get_async_enrollment_collection()
+        students = await collection.aggregate(_students_pipeline(names=False), allowDiskUse=True).to_list(length=None)
+        return [summary[0] for summary in _student_summaries(students)]
         
     except Exception as e:
         logger.error(f"Error reading student IDs from MongoDB: {e}")
         return []
 
+def get_all_student_summaries() -> List[Tuple[str, str]]:
+    """
+    Get the ID and name of every student in MongoDB.
+    
+    Returns:
+        List of (student ID, "First Last") tuples, sorted by student ID
+    """
+    try:
+        collection = get_enrollment_collection()
+        return _student_summaries(collection.aggregate(_students_pipeline(), allowDiskUse=True))
+        
+    except Exception as e:
+        logger.error(f"Error reading student summaries from MongoDB: {e}")
+        return []
+
+async def get_all_student_summaries_async() -> List[Tuple[str, str]]:
+    """
+    Get the ID and name of every student in MongoDB without blocking the event loop.
+    
+    Returns:
+        List of (student ID, "First Last") tuples, sorted by student ID
+    """
+    try:
+        collection = get_async_enrollment_collection()
+        students = await collection.aggregate(_students_pipeline(), allowDiskUse=True).to_list(length=None)
+        return _student_summaries(students)
+        
+    except Exception as e:
+        logger.error(f"Error reading student summaries from MongoDB: {e}")
+        return []
+
+def _student_summaries(students) -> List[Tuple[str, str]]:
+    """
+    Turn _students_pipeline documents into (student ID, "First Last") tuples.
+    
+    Args:
+        students: Flat student documents with id, and optionally first_name and last_name
+        
+    Returns:
+        Summaries in input order
+    """
+    summaries = []
+    
+    for student in students:
+        name = f"{student.get('first_name', '')} {student.get('last_name', '')}".strip()
+        summaries.append((_student_id_str(student['id']), name))
+    
+    return summaries
+
+# One document per student with an id, shared by the listing and count pipelines
+_STUDENT_ROW_STAGES = [
+    {"$unwind": "$students_info"},
+    {"$match": {"students_info.id": {"$ne": None}}},
+]
+
+def _students_pipeline(limit: Optional[int] = None, names: bool = True) -> List[Dict[str, Any]]:
+    """
+    Build the aggregation returning one flat document per student, sorted by ID.
+    
+    The sort is on the stored binary id, in BSON order: length, then subtype,
+    then bytes. Every id is 16 bytes, so legacy subtype 3 ids come first as
+    one block, followed by standard subtype 4 ids. Within a subtype the order
+    matches the ids' hex strings. The order is deterministic, which is all the
+    "first N" and "first student" helpers need, but it is not plain UUID
+    string order when both subtypes are present.
+    
+    Args:
+        limit: Maximum number of students to return, or None for all
+        names: Whether to include first_name and last_name
+        
+    Returns:
+        Aggregation pipeline
+    """
+    fields = {"_id": 0, "id": "$students_info.id"}
+    if names:
+        fields["first_name"] = "$students_info.first_name"
+        fields["last_name"] = "$students_info.last_name"
+    
+    pipeline = [*_STUDENT_ROW_STAGES, {"$sort": {"students_info.id": 1}}]
+    if limit is not None:
+        pipeline.append({"$limit": limit})
+    pipeline.append({"$project": fields})
+    return pipeline
+
+def count_students() -> int:
+    """
+    Count the students that _students_pipeline would return, counted server-side.
+    
+    Returns:
+        Number of students with an ID, or 0 on error
+    """
+    try:
+        collection = get_enrollment_collection()
+        for result in collection.aggregate([*_STUDENT_ROW_STAGES, {"$count": "count"}]):
+            return result['count']
+        return 0
+        
+    except Exception as e:
+        logger.error(f"Error counting students in MongoDB: {e}")
+        return 0
+
+async def count_students_async() -> int:
+    """
+    Count the students that _students_pipeline would return without blocking the event loop.
+    
+    Returns:
+        Number of students with an ID, or 0 on error
+    """
+    try:
+        collection = get_async_enrollment_collection()
+        results = await collection.aggregate([*_STUDENT_ROW_STAGES, {"$count": "count"}]).to_list(length=1)
+        return results[0]['count'] if results else 0
+        
+    except Exception as e:
+        logger.error(f"Error counting students in MongoDB: {e}")
+        return 0
+
+def get_first_n_student_summaries(n: int = 5) -> List[Tuple[str, str]]:
+    """
+    Get the ID and name of the first n students from MongoDB, sliced server-side.
+    
+    Args:
+        n: Maximum number of students to return
+        
+    Returns:
+        List of up to n (student ID, "First Last") tuples, sorted by student ID
+    """
+    try:
+        collection = get_enrollment_collection()
+        return _student_summaries(collection.aggregate(_students_pipeline(n)))
+        
+    except Exception as e:
+        logger.error(f"Error reading student summaries from MongoDB: {e}")
+        return []
+
+async def get_first_n_student_summaries_async(n: int = 5) -> List[Tuple[str, str]]:
+    """
+    Get the ID and name of the first n students without blocking the event loop.
+    
+    Args:
+        n: Maximum number of students to return
+        
+    Returns:
+        List of up to n (student ID, "First Last") tuples, sorted by student ID
+    """
+    try:
+        collection = get_async_enrollment_collection()
+        students = await collection.aggregate(_students_pipeline(n)).to_list(length=n)
+        return _student_summaries(students)
+        
+    except Exception as e:
+        logger.error(f"Error reading student summaries from MongoDB: {e}")
+        return []
+
+def get_first_student_id() -> Optional[str]:
+    """
+    Get the UUID of the first student in display order from MongoDB.
+    
+    Returns:
+        Student UUID as string, or None if there are no students
+    """
+    try:
+        collection = get_enrollment_collection()
+        for student in collection.aggregate(_students_pipeline(1, names=False)):
+            return _student_id_str(student['id'])
+        return None
+        
+    except Exception as e:
+        logger.error(f"Error reading first student ID from MongoDB: {e}")
+        return None
+
+async def get_first_student_id_async() -> Optional[str]:
+    """
+    Get the UUID of the first student in display order without blocking the event loop.
+    
+    Returns:
+        Student UUID as string, or None if there are no students
+    """
+    try:
+        collection = get_async_enrollment_collection()
+        students = await collection.aggregate(_students_pipeline(1, names=False)).to_list(length=1)
+        return _student_id_str(students[0]['id']) if students else None
+        
+    except Exception as e:
+        logger.error(f"Error reading first student ID from MongoDB: {e}")
+        return None
+
 def create_student(student_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create a new student record in MongoDB.
@@ -179,8 +475,8 @@ def create_student(student_data: Dict[str, Any]) -> Dict[str, Any]:
                 "message": f"Invalid student ID format: {student_id}. Expected format: STU### (e.g., STU001)"
             }
         
-        # Check if student already exists
-        if get_student_by_id(student_id):
+        # Check if student already exists, stopping at the first indexed match
+        if collection.count_documents({"uuid_str": student_id}, limit=1):
             return {
                 "status": "error",
                 "message": f"Student with ID {student_id} already exists"
@@ -217,118 +513,158 @@ def update_student(student_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
     try:
         collection = get_enrollment_collection()
         
-        # Get the current student record to find parent document
-        parent_doc = collection.find_one({"uuid_str": student_id})
-        print(f"DEBUG: Parent document: {parent_doc}")
-        if not parent_doc or "students_info" not in parent_doc:
-            return {
-                "status": "error",
-                "message": f"Parent document with uuid_str {student_id} not found or has no students_info"
-            }
+        parent_updates, student_updates, ignored_fields = _split_student_updates(updates)
         
-        # Find the correct student in students_info
-        students = parent_doc["students_info"]
-        print(f"DEBUG: Students: {students}")
-
-        if not students:
-            return {
-                "status": "error",
-                "message": f"No students found in students_info for parent {student_id}"
-            }
-        # For now, update the first student (or you can add logic to match by name, etc.)
-        student = students[0]
-        student_uuid = student["id"]  # This is a Binary UUID
-        print(f"DEBUG: Will update student with Binary UUID: {student_uuid}")
-        
-        # Define valid fields
-        parent_fields = {"email", "phone"}
-        student_fields = {
-            "first_name", "last_name", "birthdate", "gender", "address", "has_mailing_address",
-            "mailing_address", "info_status", "step_completed", "created_at", "updated_at",
-            "application_info", "medical_info", "care_giver_info", "special_assistance_info", "documents"
-        }
+        if ignored_fields:
+            logger.info(f"Ignored fields (not in schema): {ignored_fields}")
+        
+        if not (student_updates or parent_updates):
+            return _update_result(student_id, 0, parent_updates, student_updates)
         
-        # Map our simplified field names to the actual MongoDB structure
-        field_mapping = {
-            'first_name': 'students_info.$.first_name',
-            'last_name': 'students_info.$.last_name',
-            'birthdate': 'students_info.$.birthdate',
-            'gender': 'students_info.$.gender',
-            'address': 'students_info.$.address',
-            'has_mailing_address': 'students_info.$.has_mailing_address',
-            'mailing_address': 'students_info.$.mailing_address',
-            'info_status': 'students_info.$.info_status',
-            'step_completed': 'students_info.$.step_completed',
-            'created_at': 'students_info.$.created_at',
-            'updated_at': 'students_info.$.updated_at',
-            'application_info': 'students_info.$.application_info',
-            'medical_info': 'students_info.$.medical_info',
-            'care_giver_info': 'students_info.$.care_giver_info',
-            'special_assistance_info': 'students_info.$.special_assistance_info',
-            'documents': 'students_info.$.documents',
+        # Apply updates to the first student (or you can add logic to match by name, etc.)
+        logger.debug("Updating student %s with updates: %s %s", student_id, parent_updates, student_updates)
+        result = collection.update_one(
+            {"uuid_str": student_id, "students_info.0": {"$exists": True}},
+            _update_pipeline(parent_updates, student_updates)
+        )
+        logger.debug("MongoDB update result: %s", result.raw_result)
+        if not result.matched_count:
+            return _update_not_found(student_id)
+        
+        return _update_result(student_id, result.modified_count, parent_updates, student_updates)
+        
+    except Exception as e:
+        logger.error(f"Error updating student in MongoDB: {e}")
+        return {
+            "status": "error",
+            "message": f"Error updating student: {e}"
         }
+
+async def update_student_async(student_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Update a student record in MongoDB without blocking the event loop.
+    Updates fields within the students_info array.
+    
+    Args:
+        student_id: Student ID (UUID string) to update (parent uuid_str)
+        updates: Dictionary of field updates
         
-        parent_updates = {}
-        student_updates = {}
-        ignored_fields = []
-        
-        for field, new_value in updates.items():
-            if field in parent_fields:
-                parent_updates[field] = new_value
-            elif field in student_fields:
-                student_updates[field_mapping[field]] = new_value
-            elif field == 'name':
-                # Split name into first and last name
-                name_parts = new_value.strip().split(' ', 1)
-                student_updates['students_info.$.first_name'] = name_parts[0]
-                if len(name_parts) > 1:
-                    student_updates['students_info.$.last_name'] = name_parts[1]
-                else:
-                    student_updates['students_info.$.last_name'] = ''
-            else:
-                ignored_fields.append(field)
+    Returns:
+        Result of the update operation
+    """
+    try:
+        collection = get_async_enrollment_collection()
+        
+        parent_updates, student_updates, ignored_fields = _split_student_updates(updates)
         
         if ignored_fields:
-            print(f"Ignored fields (not in schema): {ignored_fields}")
-        
-        # Apply updates
-        modified_count = 0
-        
-        if student_updates:
-            print(f"DEBUG: Updating student {student_id} (student_info.id={student_uuid}) with updates: {student_updates}")
-            result = collection.update_one(
-                {"uuid_str": student_id, "students_info.id": student_uuid},
-                {"$set": student_updates}
-            )
-            print(f"DEBUG: MongoDB update result: {result.raw_result}")
-            modified_count += result.modified_count
-        
-        if parent_updates:
-            print(f"DEBUG: Updating parent document {parent_doc.get('_id')} with updates: {parent_updates}")
-            result = collection.update_one(
-                {"_id": parent_doc.get('_id')},
-                {"$set": parent_updates}
-            )
-            print(f"DEBUG: MongoDB parent update result: {result.raw_result}")
-            modified_count += result.modified_count
-        
-        if modified_count > 0:
-            return {
-                "status": "success",
-                "message": f"Successfully updated student {student_id}",
-                "modified_count": modified_count,
-                "updates": {**parent_updates, **student_updates}
-            }
-        else:
-            return {
-                "status": "success",
-                "message": "No changes were made (values might be the same or fields not found)",
-                "modified_count": 0
-            }
+            logger.info(f"Ignored fields (not in schema): {ignored_fields}")
+        
+        if not (student_updates or parent_updates):
+            return _update_result(student_id, 0, parent_updates, student_updates)
+        
+        # Apply updates to the first student (or you can add logic to match by name, etc.)
+        result = await collection.update_one(
+            {"uuid_str": student_id, "students_info.0": {"$exists": True}},
+            _update_pipeline(parent_updates, student_updates)
+        )
+        if not result.matched_count:
+            return _update_not_found(student_id)
+        
+        return _update_result(student_id, result.modified_count, parent_updates, student_updates)
         
     except Exception as e:
         logger.error(f"Error updating student in MongoDB: {e}")
         return {
             "status": "error",
             "message": f"Error updating student: {e}"
+        }
+
+def _split_student_updates(updates: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], List[str]]:
+    """
+    Split simplified field updates into enrollment-level and students_info updates.
+    
+    Args:
+        updates: Dictionary of field updates
+        
+    Returns:
+        Tuple of (parent $set fields, students_info.$ $set fields, ignored field names)
+    """
+    parent_updates = {}
+    student_updates = {}
+    ignored_fields = []
+    
+    for field, new_value in updates.items():
+        if field in _PARENT_FIELDS:
+            parent_updates[field] = new_value
+        elif field in _STUDENT_FIELD_MAPPING:
+            student_updates[_STUDENT_FIELD_MAPPING[field]] = new_value
+        elif field == 'name':
+            # Split name into first and last name
+            name_parts = new_value.strip().split(' ', 1)
+            student_updates['students_info.$.first_name'] = name_parts[0]
+            if len(name_parts) > 1:
+                student_updates['students_info.$.last_name'] = name_parts[1]
+            else:
+                student_updates['students_info.$.last_name'] = ''
+        else:
+            ignored_fields.append(field)
+    
+    return parent_updates, student_updates, ignored_fields
+
+def _update_pipeline(parent_updates: Dict[str, Any], student_updates: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Build the pipeline update applying parent fields and first-student fields in one round-trip.
+    
+    The first students_info entry is rebuilt server-side with $mergeObjects, so the
+    enrollment never has to be fetched to find it. Values are wrapped in $literal so
+    strings starting with "$" are stored as given rather than read as field paths.
+    
+    Args:
+        parent_updates: Enrollment-level fields from _split_student_updates
+        student_updates: students_info.$ fields from _split_student_updates
+        
+    Returns:
+        Update pipeline for update_one
+    """
+    fields = {field: {"$literal": value} for field, value in parent_updates.items()}
+    
+    if student_updates:
+        first_student_updates = {
+            field.split('.$.', 1)[1]: {"$literal": value}
+            for field, value in student_updates.items()
+        }
+        fields["students_info"] = {"$concatArrays": [
+            [{"$mergeObjects": [{"$arrayElemAt": ["$students_info", 0]}, first_student_updates]}],
+            {"$slice": ["$students_info", 1, {"$size": "$students_info"}]}
+        ]}
+    
+    return [{"$set": fields}]
+
+def _update_not_found(student_id: str) -> Dict[str, Any]:
+    """Build the error result for an update that matched no enrollment with students."""
+    return {
+        "status": "error",
+        "message": f"Parent document with uuid_str {student_id} not found or has no students_info"
+    }
+
+def _update_result(
+    student_id: str,
+    modified_count: int,
+    parent_updates: Dict[str, Any],
+    student_updates: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the result of a student update from the number of modified documents."""
+    if modified_count > 0:
+        return {
+            "status": "success",
+            "message": f"Successfully updated student {student_id}",
+            "modified_count": modified_count,
+            "updates": {**parent_updates, **student_updates}
+        }
+    else:
+        return {
+            "status": "success",
+            "message": "No changes were made (values might be the same or fields not found)",
+            "modified_count": 0
         } 
\ No newline at end of file
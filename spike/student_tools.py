@@ -1,13 +1,45 @@
 import pandas as pd
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+# csv_path -> ((mtime_ns, size), {student_id: row}), rebuilt when the file changes
+_STUDENT_INDEX: Dict[str, Tuple[Tuple[int, int], Dict[str, Dict[str, Any]]]] = {}
 
 def load_student_data(csv_path: str = "students.csv") -> pd.DataFrame:
     """Load student data from CSV file."""
     if not os.path.exists(csv_path):
         raise FileNotFoundError(f"Student CSV file not found: {csv_path}")
     
-    return pd.read_csv(csv_path)
+    # Read IDs as strings directly instead of casting the parsed column afterwards
+    return pd.read_csv(csv_path, dtype={'student_id': str})
+
+def _student_index(csv_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Index the student CSV by student ID, re-reading it only after the file changes.
+    
+    Args:
+        csv_path: Path to the CSV file containing student data
+        
+    Returns:
+        Dictionary mapping each student ID to its row, first occurrence wins
+    """
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"Student CSV file not found: {csv_path}")
+    
+    stat = os.stat(csv_path)
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+    cached = _STUDENT_INDEX.get(csv_path)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+    
+    df = load_student_data(csv_path)
+    
+    index = {}
+    for row in df.to_dict('records'):
+        index.setdefault(row['student_id'], row)
+    
+    _STUDENT_INDEX[csv_path] = (fingerprint, index)
+    return index
 
 def get_student_by_id(student_id: str, csv_path: str = "students.csv") -> Optional[Dict[str, Any]]:
     """
@@ -21,19 +53,10 @@ def get_student_by_id(student_id: str, csv_path: str = "students.csv") -> Option
         Dictionary containing student information if found, None otherwise
     """
     try:
-        df = load_student_data(csv_path)
-        
-        # Convert student_id column to string for comparison
-        df['student_id'] = df['student_id'].astype(str)
-        
-        # Search for the student
-        student_row = df[df['student_id'] == student_id]
-        
-        if student_row.empty:
-            return None
+        student_row = _student_index(csv_path).get(student_id)
         
-        # Convert to dictionary and return first match
-        return student_row.iloc[0].to_dict()
+        # Copy so callers cannot modify the cached index
+        return dict(student_row) if student_row is not None else None
         
     except Exception as e:
         print(f"Error reading student data: {e}")
@@ -67,8 +90,7 @@ def get_all_student_ids(csv_path: str = "students.csv") -> list:
         List of all student IDs
     """
     try:
-        df = load_student_data(csv_path)
-        return df['student_id'].astype(str).tolist()
+        return list(_student_index(csv_path))
     except Exception as e:
         print(f"Error reading student data: {e}")
         return [] 
\ No newline at end of file
@@ -4,48 +4,11 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from typing import Optional, Dict, Any
-import uuid
-from bson import Binary
 from api.database import get_enrollment_collection
+from student_mongodb_tools import _student_record_pipeline, _build_student_record, validate_student_id_format
+import logging
 
-
-def binary_to_uuid_string(binary_obj) -> str:
-    """
-    Convert a Binary UUID object to a string UUID.
-    
-    Args:
-        binary_obj: Binary UUID object from MongoDB
-        
-    Returns:
-        String representation of the UUID
-    """
-    try:
-        if isinstance(binary_obj, Binary):
-            # For Binary objects, we can access the bytes directly
-            return str(uuid.UUID(bytes=binary_obj))
-        else:
-            # If it's already a string or other format
-            return str(binary_obj)
-    except Exception as e:
-        print(f"Error converting Binary to UUID string: {e}")
-        return None
-
-
-def validate_uuid_format(student_id: str) -> bool:
-    """
-    Validate if the provided string is a valid UUID.
-    
-    Args:
-        student_id: The ID to validate
-        
-    Returns:
-        True if valid UUID format, False otherwise
-    """
-    try:
-        uuid.UUID(student_id)
-        return True
-    except (ValueError, AttributeError):
-        return False
+logger = logging.getLogger(__name__)
 
 
 def get_student_by_id(student_id: str) -> Optional[Dict[str, Any]]:
@@ -59,49 +22,34 @@ def get_student_by_id(student_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary containing student information if found, None otherwise
     """
-    print(f"DEBUG: get_student_by_id called with student_id: {student_id}")
+    logger.debug("get_student_by_id called with student_id: %s", student_id)
+    
+    if not validate_student_id_format(student_id):
+        logger.debug("Rejecting malformed student ID: %s", student_id)
+        return None
     
     try:
-        print(f"DEBUG: Getting enrollment collection...")
         collection = get_enrollment_collection()
-        print(f"DEBUG: Collection obtained successfully")
         
-        parent_doc = collection.find_one({
-            "uuid_str": student_id
-        })
+        # Only the first student of the enrollment is returned, already flattened
+        cursor = collection.aggregate(_student_record_pipeline({"uuid_str": student_id}, limit=1))
         
-        if parent_doc and 'students_info' in parent_doc:
-            # Find the specific student within the array
-            for i, student in enumerate(parent_doc['students_info']):
-                
-                student_record = {
-                    'student_id': student_id,
-                    'first_name': student.get('first_name', ''),
-                    'last_name': student.get('last_name', ''),
-                    'name': f"{student.get('first_name', '')} {student.get('last_name', '')}".strip(),
-                    'email': parent_doc.get('email', ''),
-                    'phone': parent_doc.get('phone', ''),
-                    'birthdate': student.get('birthdate', ''),
-                    'gender': student.get('gender', ''),
-                    'address': student.get('address', {}),
-                    'applying_grade': student.get('application_info', {}).get('applyingGrade', ''),
-                    'documents': student.get('documents', {}),
-                    'parent_doc_id': str(parent_doc.get('_id', ''))
-                }
-                print(f"DEBUG: ✅ Returning student record for: {student_record['name']}")
-                return student_record
+        student_record = _build_student_record(student_id, next(cursor, None))
+        if student_record:
+            logger.debug("Returning student record for: %s", student_record['name'])
+            return student_record
     
-        print(f"DEBUG: ❌ Student {student_id} not found in any document")
+        logger.debug("Student %s not found in any document", student_id)
         return None
         
     except Exception as e:
-        print(f"DEBUG: ❌ Exception in get_student_by_id: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error fetching student %s: %s", student_id, e)
         return None
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    
     # Test with a sample UUID
     test_uuid = "ebbd816b-6191-11f0-9ec4-a134ade00957"
     # test_uuid = "1ef47dda-5884-422b-b84b-2ee3d119b0c7"
@@ -5,24 +5,25 @@ Student Validation API Startup Script
 This script starts the FastAPI application for the student validation service.
 """
 
+import importlib.util
 import os
 import sys
 import uvicorn
 from pathlib import Path
 
+REQUIRED_PACKAGES = ("fastapi", "uvicorn", "pydantic", "pandas")
+
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        import fastapi
-        import uvicorn
-        import pydantic
-        import pandas
-        print("✅ All required dependencies are installed")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+    # Locate the packages without importing them; importing pandas alone is slow
+    missing = [name for name in REQUIRED_PACKAGES if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"❌ Missing dependency: {', '.join(missing)}")
         print("Please install dependencies with: pip install -r requirements.txt")
         return False
+    
+    print("✅ All required dependencies are installed")
+    return True
 
 def check_environment():
     """Check if the environment is properly set up."""
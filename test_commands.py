@@ -5,6 +5,10 @@ Common test commands for the Student Validation API.
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Marker groups that together cover the whole suite and can run side by side
+PARALLEL_GROUPS = ["unit", "integration", "api"]
 
 
 def run_command(cmd: list):
@@ -14,12 +18,26 @@ def run_command(cmd: list):
     return result.returncode == 0
 
 
+def run_parallel(base_cmd: list):
+    """Run each marker group in its own pytest process and return success status."""
+    cmds = [base_cmd + ["-q", "-m", group, "tests/"] for group in PARALLEL_GROUPS]
+    
+    # subprocess.run releases the GIL while waiting, so threads are enough
+    with ThreadPoolExecutor(max_workers=len(cmds)) as executor:
+        results = list(executor.map(run_command, cmds))
+    
+    for group, success in zip(PARALLEL_GROUPS, results):
+        print(f"{'✅' if success else '❌'} {group}")
+    return all(results)
+
+
 def main():
     """Main function to handle different test commands."""
     if len(sys.argv) < 2:
         print("Usage: python test_commands.py <command>")
         print("\nAvailable commands:")
         print("  all          - Run all tests")
+        print("  parallel     - Run unit, integration and API tests concurrently")
         print("  unit         - Run only unit tests")
         print("  integration  - Run only integration tests")
         print("  api          - Run only API tests")
@@ -35,6 +53,9 @@ def main():
     
     if command == "all":
         cmd = base_cmd + ["-v", "tests/"]
+    elif command == "parallel":
+        success = run_parallel(base_cmd)
+        sys.exit(0 if success else 1)
     elif command == "unit":
         cmd = base_cmd + ["-v", "-m", "unit", "tests/"]
     elif command == "integration":
@@ -3,6 +3,7 @@ Pytest configuration and shared fixtures.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 from typing import Generator, AsyncGenerator
 from api.database import test_connection, get_enrollment_collection
@@ -45,16 +46,16 @@ def validation_service(test_database):
     return ValidationServiceFactory.create_mongo_service()
 
 
-@pytest.fixture(scope="session")
-def valid_enrollment_uuid(enrollment_repository) -> str:
+@pytest_asyncio.fixture(scope="session")
+async def valid_enrollment_uuid(enrollment_repository) -> str:
     """Get a valid enrollment UUID from the database."""
-    uuids = enrollment_repository.get_all_uuids()
+    uuids = await enrollment_repository.get_all_uuids()
     if not uuids:
         pytest.skip("No enrollment UUIDs found in database")
     return uuids[0]
 
 
-@pytest.fixture(scope="session")
-def sample_enrollment_data(enrollment_repository, valid_enrollment_uuid):
+@pytest_asyncio.fixture(scope="session")
+async def sample_enrollment_data(enrollment_repository, valid_enrollment_uuid):
     """Get sample enrollment data."""
-    return enrollment_repository.get_by_uuid(valid_enrollment_uuid) 
\ No newline at end of file
+    return await enrollment_repository.get_by_uuid(valid_enrollment_uuid) 
\ No newline at end of file
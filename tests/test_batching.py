@@ -0,0 +1,108 @@
+"""
+AsyncBatcher tests using an in-memory fake collection.
+"""
+
+import asyncio
+import pytest
+from pymongo import InsertOne
+from pymongo.errors import BulkWriteError, WriteError
+
+from api.batching import AsyncBatcher
+
+
+class FakeCollection:
+    """Records bulk writes and rejects documents flagged as duplicates."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def bulk_write(self, operations, ordered=True):
+        self.batches.append(operations)
+        write_errors = [
+            {"index": index, "code": 11000, "errmsg": "duplicate key error"}
+            for index, operation in enumerate(operations)
+            if operation._doc.get("duplicate")
+        ]
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors})
+
+
+@pytest.mark.unit
+class TestAsyncBatcher:
+    """Test coalescing of concurrent writes into bulk writes."""
+
+    @pytest.fixture
+    def collection(self):
+        """Fake collection fixture."""
+        return FakeCollection()
+
+    @pytest.mark.asyncio
+    async def test_flushes_at_max_batch_size(self, collection):
+        """Test that a full batch is written without waiting for the delay."""
+        batcher = AsyncBatcher(lambda: collection, max_batch_size=3, max_delay=60)
+
+        await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(InsertOne({"n": n})) for n in range(3))),
+            timeout=1
+        )
+
+        assert [len(batch) for batch in collection.batches] == [3]
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_max_delay(self, collection):
+        """Test that a partial batch is written once the delay elapses."""
+        batcher = AsyncBatcher(lambda: collection, max_batch_size=50, max_delay=0.01)
+
+        await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(InsertOne({"n": n})) for n in range(2))),
+            timeout=1
+        )
+
+        assert [len(batch) for batch in collection.batches] == [2]
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_write_error_only_fails_its_own_operation(self, collection):
+        """Test that a rejected index raises on its own waiter only."""
+        batcher = AsyncBatcher(lambda: collection, max_batch_size=3, max_delay=60)
+
+        results = await asyncio.gather(
+            batcher.submit(InsertOne({"n": 0})),
+            batcher.submit(InsertOne({"n": 1, "duplicate": True})),
+            batcher.submit(InsertOne({"n": 2})),
+            return_exceptions=True
+        )
+
+        assert results[0] is None
+        assert isinstance(results[1], WriteError)
+        assert results[1].code == 11000
+        assert results[2] is None
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_restarts_dead_worker(self, collection):
+        """Test that a submit after the worker died starts a new one."""
+        batcher = AsyncBatcher(lambda: collection, max_batch_size=1)
+
+        await batcher.submit(InsertOne({"n": 0}))
+        batcher._worker.cancel()
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(batcher.submit(InsertOne({"n": 1})), timeout=1)
+
+        assert len(collection.batches) == 2
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_operations(self, collection):
+        """Test that close writes queued operations before stopping."""
+        batcher = AsyncBatcher(lambda: collection, max_batch_size=50, max_delay=0.05)
+
+        pending = asyncio.ensure_future(batcher.submit(InsertOne({"n": 0})))
+        await asyncio.sleep(0)
+        await batcher.close()
+
+        await asyncio.wait_for(pending, timeout=1)
+        assert [len(batch) for batch in collection.batches] == [1]
+        assert batcher._worker is None
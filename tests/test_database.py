@@ -22,9 +22,10 @@ class TestEnrollmentRepository:
         assert enrollment_repository is not None
         assert isinstance(enrollment_repository, MongoEnrollmentRepository)
 
-    def test_get_all_uuids(self, enrollment_repository):
+    @pytest.mark.asyncio
+    async def test_get_all_uuids(self, enrollment_repository):
         """Test getting all enrollment UUIDs."""
-        uuids = enrollment_repository.get_all_uuids()
+        uuids = await enrollment_repository.get_all_uuids()
         assert isinstance(uuids, list)
         
         if uuids:
@@ -34,28 +35,54 @@ class TestEnrollmentRepository:
                 assert len(uuid_str) == 36  # UUID length
                 assert uuid_str.count('-') == 4  # UUID hyphens
 
-    def test_get_by_uuid_existing(self, enrollment_repository, valid_enrollment_uuid):
+    @pytest.mark.asyncio
+    async def test_get_by_uuid_existing(self, enrollment_repository, valid_enrollment_uuid):
         """Test retrieving existing enrollment by UUID."""
-        enrollment = enrollment_repository.get_by_uuid(valid_enrollment_uuid)
+        enrollment = await enrollment_repository.get_by_uuid(valid_enrollment_uuid)
         
         assert enrollment is not None
         assert isinstance(enrollment, dict)
         assert enrollment.get("uuid_str") == valid_enrollment_uuid
 
-    def test_get_by_uuid_nonexistent(self, enrollment_repository):
+    @pytest.mark.asyncio
+    async def test_get_by_uuid_nonexistent(self, enrollment_repository):
         """Test retrieving non-existent enrollment by UUID."""
         fake_uuid = "00000000-0000-0000-0000-000000000000"
-        enrollment = enrollment_repository.get_by_uuid(fake_uuid)
+        enrollment = await enrollment_repository.get_by_uuid(fake_uuid)
         assert enrollment is None
 
-    def test_exists_method(self, enrollment_repository, valid_enrollment_uuid):
+    @pytest.mark.asyncio
+    async def test_get_email_by_uuid(self, enrollment_repository, valid_enrollment_uuid):
+        """Test retrieving only the email of an enrollment."""
+        enrollment = await enrollment_repository.get_email_by_uuid(valid_enrollment_uuid)
+        
+        assert enrollment is not None
+        assert list(enrollment) == ["email"]
+        
+        fake_uuid = "00000000-0000-0000-0000-000000000000"
+        assert await enrollment_repository.get_email_by_uuid(fake_uuid) is None
+
+    @pytest.mark.asyncio
+    async def test_summarize_by_uuid(self, enrollment_repository, valid_enrollment_uuid, sample_enrollment_data):
+        """Test the server-side enrollment summary."""
+        summary = await enrollment_repository.summarize_by_uuid(valid_enrollment_uuid)
+        
+        assert summary is not None
+        assert summary["students_count"] == len(sample_enrollment_data.get("students_info", []))
+        assert "students_info" not in summary
+        
+        fake_uuid = "00000000-0000-0000-0000-000000000000"
+        assert await enrollment_repository.summarize_by_uuid(fake_uuid) is None
+
+    @pytest.mark.asyncio
+    async def test_exists_method(self, enrollment_repository, valid_enrollment_uuid):
         """Test the exists method."""
         # Test with existing UUID
-        assert enrollment_repository.exists(valid_enrollment_uuid) is True
+        assert await enrollment_repository.exists(valid_enrollment_uuid) is True
         
         # Test with non-existent UUID
         fake_uuid = "00000000-0000-0000-0000-000000000000"
-        assert enrollment_repository.exists(fake_uuid) is False
+        assert await enrollment_repository.exists(fake_uuid) is False
 
     def test_enrollment_data_structure(self, sample_enrollment_data):
         """Test the structure of enrollment data."""